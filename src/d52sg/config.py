@@ -1,54 +1,85 @@
 """Config loading and validation for D52 scheduling app."""
 
+import re
+import sys
 from datetime import date, time, timedelta
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
-import yaml
-
 from d52sg.models import DayOfWeek, FieldSlot, League, Team
 
 
+_TIME_RE = re.compile(r"^\s*(\d{1,2})(?::(\d{2}))?\s*([ap]m)?\s*$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
 def parse_time(s: str) -> time:
     """Parse time strings like '5:30pm', '10am', '17:00'."""
-    s = s.strip()
-    s_lower = s.lower()
-
-    is_pm = s_lower.endswith("pm")
-    is_am = s_lower.endswith("am")
-
-    # Strip am/pm suffix
-    s_clean = s_lower
-    if is_pm:
-        s_clean = s_clean[:-2].strip()
-    elif is_am:
-        s_clean = s_clean[:-2].strip()
-
-    if ":" in s_clean:
-        parts = s_clean.split(":")
-        h = int(parts[0])
-        m = int(parts[1])
-    else:
-        h = int(s_clean)
-        m = 0
-
-    if is_pm and h < 12:
+    m = _TIME_RE.match(s)
+    if not m:
+        raise ValueError(f"Cannot parse time: {s!r}")
+    h = int(m.group(1))
+    minute = int(m.group(2) or 0)
+    suffix = (m.group(3) or "").lower()
+
+    if suffix == "pm" and h < 12:
         h += 12
-    elif is_am and h == 12:
+    elif suffix == "am" and h == 12:
         h = 0
 
-    return time(h, m)
+    return time(h, minute)
 
 
+@lru_cache(maxsize=None)
 def parse_date(s: str) -> date:
     """Parse date string YYYY-MM-DD."""
-    parts = s.strip().split("-")
-    return date(int(parts[0]), int(parts[1]), int(parts[2]))
+    s = s.strip()
+    try:
+        return date.fromisoformat(s)
+    except ValueError:
+        # fromisoformat needs zero padding; also accept e.g. '2026-3-5'
+        parts = s.split("-")
+        return date(int(parts[0]), int(parts[1]), int(parts[2]))
 
 
 def parse_date_range(s: str) -> tuple[date, date]:
-    """Parse 'YYYY-MM-DD:YYYY-MM-DD' into (start, end) dates."""
-    parts = s.split(":")
-    return parse_date(parts[0]), parse_date(parts[1])
+    """Parse 'YYYY-MM-DD:YYYY-MM-DD' into (start, end) dates.
+
+    A single date 'YYYY-MM-DD' is accepted as the one-day range (d, d).
+    """
+    i = s.find(":")
+    if i < 0:
+        d = parse_date(s)
+        return d, d
+    return parse_date(s[:i]), parse_date(s[i + 1:])
+
+
+def _code(t):
+    """Intern a team code so dict lookups on it can short-circuit on identity."""
+    return sys.intern(t) if isinstance(t, str) else t
+
+
+_DEFAULT_WEEKDAY_TIME = parse_time("5:30pm")
+_DEFAULT_WEEKEND_TIME = parse_time("10am")
+
+
+def _parse_field_slots(entries: list[dict] | None,
+                       default_time: time) -> list[FieldSlot]:
+    """Build FieldSlots from a league's weekday_fields/weekend_fields list."""
+    slots = []
+    for fd in entries or ():
+        t_raw = fd.get("time")
+        exc_raw = fd.get("exclude_dates")
+        slots.append(FieldSlot(
+            field_name=fd["field"],
+            day=DayOfWeek.from_str(fd["day"]),
+            start_time=(default_time if t_raw is None
+                        else parse_time(str(t_raw))),
+            exclude_dates=(sorted({parse_date(str(d)) for d in exc_raw})
+                           if exc_raw else []),
+        ))
+    return slots
 
 
 def load_config(path: str | Path) -> dict:
@@ -58,11 +89,19 @@ def load_config(path: str | Path) -> dict:
     - season: {start_date, end_date, game_length_minutes}
     - teams: dict[code -> Team]
     - leagues: dict[code -> League]
-    - pools: {north: [codes], south: [codes]}
+    - pools: {north: (codes), south: (codes)}
     """
+    # Imported here so modules that only need the parse_* helpers don't
+    # pay for PyYAML at import time
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as Loader
+
     path = Path(path)
-    with open(path) as f:
-        raw = yaml.safe_load(f)
+    with open(path, "rb") as f:
+        raw = yaml.load(f, Loader=Loader)
 
     # Season
     season = {
@@ -74,11 +113,10 @@ def load_config(path: str | Path) -> dict:
     }
 
     # Pools
-    pools = {
-        "north": list(raw["pools"]["north"]),
-        "south": list(raw["pools"]["south"]),
-    }
-    all_team_codes = set(pools["north"] + pools["south"])
+    north = tuple(map(_code, raw["pools"]["north"]))
+    south = tuple(map(_code, raw["pools"]["south"]))
+    pools = {"north": north, "south": south}
+    all_team_codes = set(chain(north, south))
 
     # Leagues
     leagues: dict[str, League] = {}
@@ -88,42 +126,21 @@ def load_config(path: str | Path) -> dict:
         teams_val = ldata.get("teams", [])
         if isinstance(teams_val, int):
             # Auto-generate team names: BRS1, BRS2, ... for teams: 2
-            teams = [f"{code}{i}" for i in range(1, teams_val + 1)]
+            teams = [sys.intern(f"{code}{i}") for i in range(1, teams_val + 1)]
         else:
-            teams = list(teams_val)
+            teams = [_code(t) for t in teams_val]
         for t in teams:
             if t not in all_team_codes:
                 print(f"Warning: team {t} in league {code} not found in any pool")
             team_to_league[t] = code
 
-        weekday_fields = []
-        for fd in ldata.get("weekday_fields", []):
-            exclude = [parse_date(str(d)) for d in fd.get("exclude_dates", [])]
-            weekday_fields.append(FieldSlot(
-                field_name=fd["field"],
-                day=DayOfWeek.from_str(fd["day"]),
-                start_time=parse_time(str(fd.get("time", "5:30pm"))),
-                exclude_dates=exclude,
-            ))
-
-        weekend_fields = []
-        for fd in ldata.get("weekend_fields", []):
-            exclude = [parse_date(str(d)) for d in fd.get("exclude_dates", [])]
-            weekend_fields.append(FieldSlot(
-                field_name=fd["field"],
-                day=DayOfWeek.from_str(fd["day"]),
-                start_time=parse_time(str(fd.get("time", "10am"))),
-                exclude_dates=exclude,
-            ))
-
-        blackout_ranges = []
-        for br in ldata.get("blackout_dates", []):
-            s = str(br)
-            if ":" in s:
-                blackout_ranges.append(parse_date_range(s))
-            else:
-                d = parse_date(s)
-                blackout_ranges.append((d, d))
+        weekday_fields = _parse_field_slots(ldata.get("weekday_fields"),
+                                            _DEFAULT_WEEKDAY_TIME)
+        weekend_fields = _parse_field_slots(ldata.get("weekend_fields"),
+                                            _DEFAULT_WEEKEND_TIME)
+
+        blackout_ranges = [parse_date_range(str(br))
+                           for br in ldata.get("blackout_dates", [])]
 
         leagues[code] = League(
             code=code,
@@ -141,23 +158,26 @@ def load_config(path: str | Path) -> dict:
 
     for pool_name in ("north", "south"):
         for code in pools[pool_name]:
-            ovr = overrides.get(code, {})
-            no_play = [DayOfWeek.from_str(d) for d in ovr.get("no_play_days", [])]
+            league_code = team_to_league.get(code, "UNKNOWN")
+            ovr = overrides.get(code)
+            if ovr is None:
+                # Common case: no overrides, all Team defaults apply
+                teams[code] = Team(code=code, league_code=league_code,
+                                   pool=pool_name)
+                continue
+            no_play = [DayOfWeek.from_str(d)
+                       for d in ovr.get("no_play_days", [])]
             avail_we = []
             for d in ovr.get("available_weekends", []):
-                s = str(d)
-                if ":" in s:
-                    start, end = parse_date_range(s)
-                    cur = start
-                    while cur <= end:
-                        avail_we.append(cur)
-                        cur += timedelta(days=1)
-                else:
-                    avail_we.append(parse_date(s))
+                start, end = parse_date_range(str(d))
+                cur = start
+                while cur <= end:
+                    avail_we.append(cur)
+                    cur += timedelta(days=1)
 
             teams[code] = Team(
                 code=code,
-                league_code=team_to_league.get(code, "UNKNOWN"),
+                league_code=league_code,
                 pool=pool_name,
                 weekday_only=ovr.get("weekday_only", False),
                 available_weekends=avail_we,
@@ -172,18 +192,14 @@ def load_config(path: str | Path) -> dict:
 
     # Validate
     errors = []
-    for code in all_team_codes:
-        if code not in teams:
-            errors.append(f"Team {code} in pools but not constructed")
-        if code not in team_to_league:
-            errors.append(f"Team {code} in pools but not in any league")
+    errors.extend(f"Team {code} in pools but not constructed"
+                  for code in sorted(all_team_codes - teams.keys()))
+    errors.extend(f"Team {code} in pools but not in any league"
+                  for code in sorted(all_team_codes - team_to_league.keys()))
 
     for group in avoid_same_time_groups:
-        for t in group:
-            if t not in all_team_codes:
-                errors.append(
-                    f"Team {t} in avoid_same_time_groups but not in any pool"
-                )
+        errors.extend(f"Team {t} in avoid_same_time_groups but not in any pool"
+                      for t in sorted(group - all_team_codes))
 
     if errors:
         print("Config validation errors:")
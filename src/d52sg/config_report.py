@@ -1,23 +1,30 @@
 """Generate a human-readable config summary for league reps to verify."""
 
+import io
 import sys
 from datetime import date, time
+from functools import lru_cache
 from html import escape
 from pathlib import Path
 
 from d52sg.config import load_config
 
 
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
 def fmt_date(d: date) -> str:
-    return d.strftime("%b %-d")
+    return f"{_MONTHS[d.month - 1]} {d.day}"
 
 
 def fmt_date_range(start: date, end: date) -> str:
     if start.month == end.month:
-        return f"{start.strftime('%b %-d')}\u2013{end.strftime('%-d')}"
+        return f"{_MONTHS[start.month - 1]} {start.day}\u2013{end.day}"
     return f"{fmt_date(start)}\u2013{fmt_date(end)}"
 
 
+@lru_cache(maxsize=None)
 def fmt_time(t) -> str:
     h = t.hour
     m = t.minute
@@ -34,13 +41,21 @@ def fmt_time(t) -> str:
 def fmt_field_slot(fs) -> str:
     s = f"{fs.day.name} {fmt_time(fs.start_time)} @ {fs.field_name}"
     if fs.exclude_dates:
-        dates = ", ".join(fmt_date(d) for d in sorted(fs.exclude_dates))
+        dates = ", ".join(fmt_date(d) for d in fs.exclude_dates)
         s += f"  (not: {dates})"
     return s
 
 
-def _build_report_data(config: dict) -> dict:
-    """Extract structured report data from config for both text and HTML."""
+def _build_report_data(config: dict,
+                       want: frozenset[str] = frozenset({"text", "html"}),
+                       ) -> dict:
+    """Extract structured report data from config for both text and HTML.
+
+    ``want`` names the reports the data is for; structures used only by a
+    report that isn't wanted are left empty.
+    """
+    want_text = "text" in want
+    want_html = "html" in want
     season = config["season"]
     leagues = config["leagues"]
     teams = config["teams"]
@@ -48,10 +63,16 @@ def _build_report_data(config: dict) -> dict:
     ast_groups = config.get("avoid_same_time_groups", [])
     field_info = config.get("field_info", {})
 
+    # Single pass over teams: team -> league, league -> pool, and
     # league_code -> list of team override descriptions
+    team_league: dict[str, str] = {}
+    league_pools: dict[str, str] = {}
     league_overrides: dict[str, list[str]] = {}
     league_override_details: dict[str, list[tuple[str, list[str]]]] = {}
     for code, team in teams.items():
+        lc = team.league_code
+        team_league[code] = lc
+        league_pools[lc] = team.pool.capitalize()
         notes = []
         if team.weekday_only:
             notes.append("Weekday games only")
@@ -59,33 +80,31 @@ def _build_report_data(config: dict) -> dict:
             days = ", ".join(d.name for d in team.no_play_days)
             notes.append(f"Cannot play on {days}")
         if notes:
-            league_overrides.setdefault(team.league_code, []).append(
-                f"{code}: {'; '.join(notes)}"
-            )
-            league_override_details.setdefault(team.league_code, []).append(
-                (code, notes)
-            )
+            if want_text:
+                league_overrides.setdefault(lc, []).append(
+                    f"{code}: {'; '.join(notes)}"
+                )
+            if want_html:
+                league_override_details.setdefault(lc, []).append(
+                    (code, notes)
+                )
+
+    # league_code -> escaped, sorted roster line for the HTML report
+    league_roster_html: dict[str, str] = {}
+    if want_html:
+        for lc, league in leagues.items():
+            league_roster_html[lc] = ", ".join(escape(t)
+                                               for t in sorted(league.teams))
 
     # league_code -> list of avoid-same-time group descriptions
     league_ast: dict[str, list[str]] = {}
     for group in ast_groups:
-        group_sorted = sorted(group)
-        league_codes = set()
-        for t in group_sorted:
-            if t in teams:
-                league_codes.add(teams[t].league_code)
+        group_str = ", ".join(sorted(group))
+        league_codes = {team_league[t] for t in group if t in team_league}
         for lc in league_codes:
-            league_ast.setdefault(lc, []).append(
-                ", ".join(group_sorted)
-            )
-
-    # Pool membership by league
-    league_pools: dict[str, str] = {}
-    for pool_name, pool_teams in pools.items():
-        for t in pool_teams:
-            if t in teams:
-                lc = teams[t].league_code
-                league_pools[lc] = pool_name.capitalize()
+            entries = league_ast.setdefault(lc, [])
+            if group_str not in entries:
+                entries.append(group_str)
 
     return {
         "season": season,
@@ -97,13 +116,22 @@ def _build_report_data(config: dict) -> dict:
         "league_override_details": league_override_details,
         "league_ast": league_ast,
         "league_pools": league_pools,
+        "team_league": team_league,
+        "league_roster_html": league_roster_html,
     }
 
 
-def generate_report(config_path: str) -> str:
+def _as_config(config: str | Path | dict) -> dict:
+    """Accept either a loaded config dict or a path to load it from."""
+    if isinstance(config, dict):
+        return config
+    return load_config(config)
+
+
+def generate_report(config: str | Path | dict) -> str:
     """Generate plain-text config report."""
-    config = load_config(config_path)
-    data = _build_report_data(config)
+    config = _as_config(config)
+    data = _build_report_data(config, want=frozenset({"text"}))
     season = data["season"]
     leagues = data["leagues"]
 
@@ -217,10 +245,21 @@ def _fmt_field_html(field_name: str, field_info: dict) -> str:
     return escaped
 
 
-def generate_html_report(config_path: str) -> str:
+_FIELD_ROW_TMPL = ("<tr><td><strong>%s</strong></td><td>%s</td><td>%s</td>"
+                   "<td>%s</td><td>%s</td></tr>")
+
+
+def _field_row_html(label: str, fs, field_html: dict[str, str]) -> str:
+    """One row of a league's field table: label, day, time, field, excludes."""
+    exc = ", ".join(fmt_date(d) for d in fs.exclude_dates)
+    return _FIELD_ROW_TMPL % (label, fs.day.name, fmt_time(fs.start_time),
+                              field_html[fs.field_name], escape(exc))
+
+
+def generate_html_report(config: str | Path | dict) -> str:
     """Generate HTML config report."""
-    config = load_config(config_path)
-    data = _build_report_data(config)
+    config = _as_config(config)
+    data = _build_report_data(config, want=frozenset({"html"}))
     season = data["season"]
     leagues = data["leagues"]
     field_info = data["field_info"]
@@ -229,25 +268,42 @@ def generate_html_report(config_path: str) -> str:
     season_name = season.get("name", "D52 Juniors 54/80")
     title = f"{season_name} — Season Config"
 
-    parts = []
-    parts.append("<!DOCTYPE html>")
-    parts.append('<html lang="en"><head>')
-    parts.append('<meta charset="utf-8">')
-    parts.append('<meta name="viewport" content="width=device-width, initial-scale=1">')
-    parts.append(f"<title>{escape(title)}</title>")
-    parts.append(f"<style>{CSS}</style>")
-    parts.append("</head><body>")
-
-    parts.append(f"<h1>{escape(season_name)}</h1>")
-    parts.append(f'<p class="subtitle">'
-                 f'{fmt_date(season["start_date"])} &ndash; '
-                 f'{fmt_date(season["end_date"])} &middot; '
-                 f'{season["game_length_minutes"]} minute games</p>')
-    parts.append(f'<p class="intro">Please verify your league\'s information '
-                 f'below and report any corrections.</p>')
+    # Escape each league name and team code once; both recur across sections
+    league_name_html = {lc: escape(lg.full_name) for lc, lg in leagues.items()}
+    team_html = {tc: escape(tc) for lg in leagues.values() for tc in lg.teams}
+
+    # Field name -> rendered HTML (escaped, map-linked), built once per report
+    field_html: dict[str, str] = {}
+    for league in leagues.values():
+        for fs in league.weekday_fields + league.weekend_fields:
+            if fs.field_name not in field_html:
+                field_html[fs.field_name] = _fmt_field_html(fs.field_name,
+                                                            field_info)
+
+    buf = io.StringIO()
+
+    def emit(line: str):
+        buf.write(line)
+        buf.write("\n")
+
+    emit("<!DOCTYPE html>")
+    emit('<html lang="en"><head>')
+    emit('<meta charset="utf-8">')
+    emit('<meta name="viewport" content="width=device-width, initial-scale=1">')
+    emit(f"<title>{escape(title)}</title>")
+    emit(f"<style>{CSS}</style>")
+    emit("</head><body>")
+
+    emit(f"<h1>{escape(season_name)}</h1>")
+    emit(f'<p class="subtitle">'
+         f'{fmt_date(season["start_date"])} &ndash; '
+         f'{fmt_date(season["end_date"])} &middot; '
+         f'{season["game_length_minutes"]} minute games</p>')
+    emit(f'<p class="intro">Please verify your league\'s information '
+         f'below and report any corrections.</p>')
 
     # Table of contents grouped by pool
-    parts.append('<div class="toc">')
+    emit('<div class="toc">')
     for pool_name in ("north", "south"):
         pool_teams = pools.get(pool_name, [])
         if not pool_teams:
@@ -255,84 +311,60 @@ def generate_html_report(config_path: str) -> str:
         pool_leagues = []
         seen = set()
         for tc in pool_teams:
-            lc = data["teams"][tc].league_code
+            lc = data["team_league"][tc]
             if lc not in seen:
                 seen.add(lc)
                 pool_leagues.append(lc)
-        parts.append(f'<p style="margin-top:8px"><strong>'
-                     f'{pool_name.title()} Pool</strong></p>')
+        emit(f'<p style="margin-top:8px"><strong>'
+             f'{pool_name.title()} Pool</strong></p>')
         for lc in sorted(pool_leagues):
-            league = leagues[lc]
-            parts.append(f'<p><a href="#league-{lc}">'
-                         f'{escape(league.full_name)}</a></p>')
-    parts.append("</div>")
+            emit(f'<p><a href="#league-{lc}">{league_name_html[lc]}</a></p>')
+    emit("</div>")
 
     # Per-league sections
     for code in sorted(leagues.keys()):
         league = leagues[code]
+        full_name = league_name_html[code]
         pool = data["league_pools"].get(code, "?")
         team_count = len(league.teams)
         team_label = "team" if team_count == 1 else "teams"
 
-        parts.append(f'<h2 id="league-{code}">'
-                     f'{escape(league.full_name)} ({code})</h2>')
-        parts.append(f'<p>{pool} Pool &middot; {team_count} {team_label}: '
-                     f'{", ".join(escape(t) for t in sorted(league.teams))}</p>')
+        emit(f'<h2 id="league-{code}">{full_name} ({code})</h2>')
+        emit(f'<p>{pool} Pool &middot; {team_count} {team_label}: '
+             f'{data["league_roster_html"][code]}</p>')
 
         # Fields table
         if not league.has_fields:
-            parts.append(f'<p class="no-fields">No home fields &mdash; '
-                         f'all games at opponent\'s venue</p>')
+            emit(f'<p class="no-fields">No home fields &mdash; '
+                 f'all games at opponent\'s venue</p>')
         else:
             has_weekday = bool(league.weekday_fields)
             has_weekend = bool(league.weekend_fields)
 
             if has_weekday or has_weekend:
-                parts.append("<table>")
-                parts.append("<tr><th></th><th>Day</th><th>Time</th>"
-                             "<th>Field</th><th>Excludes</th></tr>")
+                emit("<table>")
+                emit("<tr><th></th><th>Day</th><th>Time</th>"
+                     "<th>Field</th><th>Excludes</th></tr>")
 
                 if has_weekday:
                     for i, fs in enumerate(league.weekday_fields):
-                        label = "Weekday" if i == 0 else ""
-                        field_html = _fmt_field_html(fs.field_name, field_info)
-                        if fs.exclude_dates:
-                            exc = ", ".join(fmt_date(d) for d in sorted(fs.exclude_dates))
-                        else:
-                            exc = ""
-                        parts.append(
-                            f"<tr><td><strong>{label}</strong></td>"
-                            f"<td>{fs.day.name}</td>"
-                            f"<td>{fmt_time(fs.start_time)}</td>"
-                            f"<td>{field_html}</td>"
-                            f"<td>{escape(exc)}</td></tr>"
-                        )
+                        emit(_field_row_html("Weekday" if i == 0 else "",
+                                             fs, field_html))
                 else:
-                    parts.append('<tr><td><strong>Weekday</strong></td>'
-                                 '<td colspan="4" class="no-fields">'
-                                 'None (all weekday games as visitor)</td></tr>')
+                    emit('<tr><td><strong>Weekday</strong></td>'
+                         '<td colspan="4" class="no-fields">'
+                         'None (all weekday games as visitor)</td></tr>')
 
                 if has_weekend:
                     for i, fs in enumerate(league.weekend_fields):
-                        label = "Weekend" if i == 0 else ""
-                        field_html = _fmt_field_html(fs.field_name, field_info)
-                        if fs.exclude_dates:
-                            exc = ", ".join(fmt_date(d) for d in sorted(fs.exclude_dates))
-                        else:
-                            exc = ""
-                        parts.append(
-                            f"<tr><td><strong>{label}</strong></td>"
-                            f"<td>{fs.day.name}</td>"
-                            f"<td>{fmt_time(fs.start_time)}</td>"
-                            f"<td>{field_html}</td>"
-                            f"<td>{escape(exc)}</td></tr>"
-                        )
+                        emit(_field_row_html("Weekend" if i == 0 else "",
+                                             fs, field_html))
                 else:
-                    parts.append('<tr><td><strong>Weekend</strong></td>'
-                                 '<td colspan="4" class="no-fields">'
-                                 'None</td></tr>')
+                    emit('<tr><td><strong>Weekend</strong></td>'
+                         '<td colspan="4" class="no-fields">'
+                         'None</td></tr>')
 
-                parts.append("</table>")
+                emit("</table>")
 
         # Blackout dates
         if league.blackout_ranges:
@@ -342,42 +374,43 @@ def generate_html_report(config_path: str) -> str:
                     ranges.append(fmt_date(start))
                 else:
                     ranges.append(f"{fmt_date(start)} &ndash; {fmt_date(end)}")
-            parts.append(f'<p class="blackout">Blackout: {", ".join(ranges)}</p>')
+            emit(f'<p class="blackout">Blackout: {", ".join(ranges)}</p>')
 
         # Team overrides
         if code in data["league_override_details"]:
             for team_code, notes in data["league_override_details"][code]:
                 for note in notes:
-                    parts.append(f'<p class="note">{escape(team_code)}: '
-                                 f'{escape(note)}</p>')
+                    emit(f'<p class="note">{team_html[team_code]}: '
+                         f'{escape(note)}</p>')
 
         # Avoid same time
         if code in data["league_ast"]:
             for group_str in data["league_ast"][code]:
-                parts.append(f'<p class="note">{escape(group_str)} will not '
-                             f'be scheduled at the same time</p>')
+                emit(f'<p class="note">{escape(group_str)} will not '
+                     f'be scheduled at the same time</p>')
 
-    parts.append("</body></html>")
-    return "\n".join(parts)
+    buf.write("</body></html>")
+    return buf.getvalue()
 
 
 def main():
     config_path = sys.argv[1] if len(sys.argv) > 1 else "config.yaml"
     output_arg = sys.argv[2] if len(sys.argv) > 2 else None
+    config = load_config(config_path)
 
     if output_arg:
         out_dir = Path(output_arg)
         out_dir.mkdir(parents=True, exist_ok=True)
 
         txt_path = out_dir / "config_report.txt"
-        txt_path.write_text(generate_report(config_path))
+        txt_path.write_text(generate_report(config))
         print(f"Written: {txt_path}")
 
         html_path = out_dir / "config_report.html"
-        html_path.write_text(generate_html_report(config_path))
+        html_path.write_text(generate_html_report(config))
         print(f"Written: {html_path}")
     else:
-        print(generate_report(config_path))
+        print(generate_report(config))
 
 
 if __name__ == "__main__":
@@ -13,14 +13,13 @@ def _slot_block_key(d: date) -> tuple[int, str]:
 
     A team can play at most once per slot block.
     """
-    iso_year, iso_week, iso_day = d.isocalendar()
-    block = "weekend" if d.weekday() >= 5 else "weekday"
-    return (iso_week, block)
+    return (d.isocalendar()[1], "weekend" if d.weekday() >= 5 else "weekday")
 
 
 def validate_schedule(games: list[Game], teams: dict, leagues: dict,
                       pools: dict,
                       avoid_same_time_groups: list[frozenset] | None = None,
+                      early_exit: bool = False,
                       ) -> dict:
     """Validate a schedule against all constraints.
 
@@ -28,12 +27,16 @@ def validate_schedule(games: list[Game], teams: dict, leagues: dict,
     - valid: bool (True if no hard constraint violations)
     - errors: list of hard constraint violations
     - warnings: list of soft constraint issues
+
+    With early_exit=True, returns as soon as a check group has produced an
+    error; errors and warnings then only cover the checks run so far.
     """
     errors = []
     warnings = []
 
-    north = set(pools["north"])
-    south = set(pools["south"])
+    # Team -> pool name; teams in neither pool are absent
+    team_pool = {t: "south" for t in pools["south"]}
+    team_pool.update((t, "north") for t in pools["north"])
 
     # Separate scheduled vs unscheduled games
     scheduled_games = [g for g in games if not g.unscheduled]
@@ -48,26 +51,64 @@ def validate_schedule(games: list[Game], teams: dict, leagues: dict,
             f"(week {g.week_number}{slot_label})"
         )
 
+    if early_exit and errors:
+        return _result(errors, warnings)
+
     # Track per-team stats
     home_counts = defaultdict(int)
     away_counts = defaultdict(int)
-    games_per_slot = defaultdict(lambda: defaultdict(int))  # team -> slot_block_key -> count
-    matchup_counts = defaultdict(lambda: defaultdict(int))
+    # Flat tuple keys: (team, slot_block_key) and (lo_team, hi_team)
+    games_per_slot: dict[tuple[str, tuple[int, str]], int] = defaultdict(int)
+    matchup_counts: dict[tuple[str, str], int] = defaultdict(int)
 
     # Track per-team (date, field) for avoid-same-day-different-field checks
     team_date_field: dict[str, list[tuple]] = defaultdict(list)
 
     # Build set of valid fields per league for Rule 1 checking
-    league_fields: dict[str, set[str]] = {}
-    for lcode, league in leagues.items():
-        fields = set()
-        for fs in league.weekday_fields + league.weekend_fields:
-            fields.add(fs.field_name)
-        league_fields[lcode] = fields
+    league_fields: dict[str, set[str]] = {
+        lcode: {fs.field_name
+                for fs in league.weekday_fields + league.weekend_fields}
+        for lcode, league in leagues.items()
+    }
+
+    # Resolve each team's league once rather than per game
+    team_league = {t: leagues[team.league_code] for t, team in teams.items()}
+    team_fields = {t: league_fields[team.league_code]
+                   for t, team in teams.items()}
+    team_weekends = {t: frozenset(team.available_weekends)
+                     for t, team in teams.items()}
+
+    # Expand blackout ranges into per-league date sets, clipped to the span
+    # of scheduled games, so blackout checks below are plain set lookups
+    league_blackout: dict[str, frozenset[date]] = {}
+    if scheduled_games:
+        first = min(g.date for g in scheduled_games)
+        last = max(g.date for g in scheduled_games)
+        one_day = timedelta(days=1)
+        for lcode, league in leagues.items():
+            days = set()
+            for start, end in league.blackout_ranges:
+                d, end = max(start, first), min(end, last)
+                while d <= end:
+                    days.add(d)
+                    d += one_day
+            league_blackout[lcode] = frozenset(days)
+    team_blackout = {t: league_blackout.get(team.league_code, frozenset())
+                     for t, team in teams.items()}
+
+    # Slot block and weekday per date; far fewer distinct dates than games
+    date_skey: dict[date, tuple[int, str]] = {}
+    date_dow: dict[date, DayOfWeek] = {}
 
     for game in scheduled_games:
+        if early_exit and errors:
+            break
         h = game.home_team
         a = game.away_team
+        skey = date_skey.get(game.date)
+        if skey is None:
+            skey = date_skey[game.date] = _slot_block_key(game.date)
+            date_dow[game.date] = DayOfWeek(game.date.weekday())
 
         if h not in teams:
             errors.append(f"Unknown home team: {h}")
@@ -80,30 +121,28 @@ def validate_schedule(games: list[Game], teams: dict, leagues: dict,
         away_counts[a] += 1
 
         # Check: no team plays twice in the same slot block (Mon-Fri or Sat-Sun)
-        skey = _slot_block_key(game.date)
-        games_per_slot[h][skey] += 1
-        games_per_slot[a][skey] += 1
+        games_per_slot[h, skey] += 1
+        games_per_slot[a, skey] += 1
 
         # Track matchups
-        key_ha = (h, a) if h < a else (a, h)
-        matchup_counts[key_ha[0]][key_ha[1]] += 1
+        matchup_counts[(h, a) if h < a else (a, h)] += 1
 
         # Check blackout dates
-        h_league = leagues[teams[h].league_code]
-        a_league = leagues[teams[a].league_code]
-        if h_league.is_blacked_out(game.date):
+        h_league = team_league[h]
+        a_league = team_league[a]
+        if game.date in team_blackout[h]:
             errors.append(
                 f"{h} plays on blackout date {game.date} "
                 f"(league {h_league.code})"
             )
-        if a_league.is_blacked_out(game.date):
+        if game.date in team_blackout[a]:
             errors.append(
                 f"{a} plays on blackout date {game.date} "
                 f"(league {a_league.code})"
             )
 
         # Check no-play-days
-        dow = DayOfWeek(game.date.weekday())
+        dow = date_dow[game.date]
         if dow in teams[h].no_play_days:
             errors.append(f"{h} plays on {dow.name} ({game.date}) — no-play day")
         if dow in teams[a].no_play_days:
@@ -112,34 +151,36 @@ def validate_schedule(games: list[Game], teams: dict, leagues: dict,
         # Check weekday-only teams on weekends
         if dow.is_weekend():
             if teams[h].weekday_only:
-                if game.date not in teams[h].available_weekends:
+                if game.date not in team_weekends[h]:
                     errors.append(
                         f"{h} (weekday-only) plays on weekend {game.date} "
                         f"without it being an available weekend"
                     )
             if teams[a].weekday_only:
-                if game.date not in teams[a].available_weekends:
+                if game.date not in team_weekends[a]:
                     errors.append(
                         f"{a} (weekday-only) plays on weekend {game.date} "
                         f"without it being an available weekend"
                     )
 
         # Check game type vs pool membership
+        h_pool = team_pool.get(h)
+        same_pool = h_pool is not None and h_pool == team_pool.get(a)
         if game.game_type == "intra":
-            if not (h in north and a in north) and not (h in south and a in south):
+            if not same_pool:
                 warnings.append(
                     f"Intra-pool game {h} vs {a} has teams from different pools"
                 )
         elif game.game_type == "crossover":
-            if (h in north and a in north) or (h in south and a in south):
+            if same_pool:
                 warnings.append(
                     f"Crossover game {h} vs {a} has teams from same pool"
                 )
 
         # Rule 1: field must belong to home or away team's league
         if game.field_name:
-            h_fields = league_fields.get(teams[h].league_code, set())
-            a_fields = league_fields.get(teams[a].league_code, set())
+            h_fields = team_fields[h]
+            a_fields = team_fields[a]
             if game.field_name not in h_fields and game.field_name not in a_fields:
                 errors.append(
                     f"Game {h} vs {a} on {game.date} uses field "
@@ -150,14 +191,24 @@ def validate_schedule(games: list[Game], teams: dict, leagues: dict,
         team_date_field[h].append((game.date, game.field_name))
         team_date_field[a].append((game.date, game.field_name))
 
+    if early_exit and errors:
+        return _result(errors, warnings)
+
     # Check: no team plays twice in same slot block (Mon-Fri or Sat-Sun)
-    for team, slot_counts in games_per_slot.items():
-        for skey, count in slot_counts.items():
-            if count > 1:
-                week, block = skey
-                errors.append(
-                    f"{team} plays {count} games in week {week} {block}"
-                )
+    over = [(key, count) for key, count in games_per_slot.items() if count > 1]
+    if over:
+        # Report grouped by team, in order of each team's first game
+        team_order: dict[str, int] = {}
+        for t, _ in games_per_slot:
+            team_order.setdefault(t, len(team_order))
+        over.sort(key=lambda kv: team_order[kv[0][0]])
+    for (team, (week, block)), count in over:
+        errors.append(
+            f"{team} plays {count} games in week {week} {block}"
+        )
+
+    if early_exit and errors:
+        return _result(errors, warnings)
 
     # Check: home/away balance within 1
     for t in teams:
@@ -168,31 +219,44 @@ def validate_schedule(games: list[Game], teams: dict, leagues: dict,
                 f"{t} home/away imbalance: {h}H/{a}A (diff={h-a})"
             )
 
+    if early_exit and errors:
+        return _result(errors, warnings)
+
     # Check: avoid_same_time groups — same date + different field is a warning
     ast_groups = avoid_same_time_groups or []
-    checked_pairs: set[tuple[str, str, date]] = set()
+    # One pass over grouped teams' games: date -> team -> fields played,
+    # plus the order in which each team first played on that date
+    date_team_fields: dict[date, dict[str, set[str]]] = defaultdict(dict)
+    team_date_rank: dict[str, dict[date, int]] = defaultdict(dict)
+    for t in set().union(*ast_groups):
+        rank = team_date_rank[t]
+        for d, f in team_date_field.get(t, ()):
+            date_team_fields[d].setdefault(t, set()).add(f)
+            rank.setdefault(d, len(rank))
     for group in ast_groups:
-        group_sorted = sorted(group)
-        for i, t1 in enumerate(group_sorted):
-            for t2 in group_sorted[i + 1:]:
-                # Build date -> set of fields for each team
-                t1_dates: dict[date, set[str]] = defaultdict(set)
-                for d, f in team_date_field.get(t1, []):
-                    t1_dates[d].add(f)
-                t2_dates: dict[date, set[str]] = defaultdict(set)
-                for d, f in team_date_field.get(t2, []):
-                    t2_dates[d].add(f)
-                for d in t1_dates:
-                    if d in t2_dates:
-                        # Same date — check if all games are at same field
-                        all_fields = t1_dates[d] | t2_dates[d]
-                        if len(all_fields) > 1:
-                            warnings.append(
-                                f"Teams {{{t1}, {t2}}} play same day "
-                                f"{d} at different fields "
-                                f"{sorted(all_fields)} "
-                                f"(avoid_same_time group)"
-                            )
+        # Only pairs that share a date can clash. Collect per pair so the
+        # warnings come out pair by pair, dates in t1's game order.
+        pair_warnings: dict[tuple[str, str], list[tuple[int, str]]] = (
+            defaultdict(list))
+        for d, team_fields_on_d in date_team_fields.items():
+            present = sorted(group.intersection(team_fields_on_d))
+            if len(present) < 2:
+                continue
+            for i, t1 in enumerate(present):
+                f1 = team_fields_on_d[t1]
+                for t2 in present[i + 1:]:
+                    # Same date — check if all games are at same field
+                    all_fields = f1 | team_fields_on_d[t2]
+                    if len(all_fields) > 1:
+                        pair_warnings[t1, t2].append((
+                            team_date_rank[t1][d],
+                            f"Teams {{{t1}, {t2}}} play same day "
+                            f"{d} at different fields "
+                            f"{sorted(all_fields)} "
+                            f"(avoid_same_time group)",
+                        ))
+        for pair in sorted(pair_warnings):
+            warnings.extend(msg for _, msg in sorted(pair_warnings[pair]))
 
     # Rule 3: max 1 team with a BYE per slot
     # BYE = team was available but not assigned a game. Blackout != bye.
@@ -200,13 +264,12 @@ def validate_schedule(games: list[Game], teams: dict, leagues: dict,
     # assigned a game that couldn't be placed on a field.
     # Group scheduled games by (week_number, weekday|weekend) slot
     slot_teams: dict[tuple[int, str], set[str]] = defaultdict(set)
-    slot_dates: dict[tuple[int, str], list[date]] = defaultdict(list)
+    slot_dates: dict[tuple[int, str], set[date]] = defaultdict(set)
     for game in scheduled_games:
-        block = "weekend" if game.date.weekday() >= 5 else "weekday"
-        skey = (game.week_number, block)
+        skey = (game.week_number, date_skey[game.date][1])
         slot_teams[skey].add(game.home_team)
         slot_teams[skey].add(game.away_team)
-        slot_dates[skey].append(game.date)
+        slot_dates[skey].add(game.date)
 
     # Track which teams have unscheduled games per slot
     unsched_slot_teams: dict[tuple[int, str], set[str]] = defaultdict(set)
@@ -220,63 +283,53 @@ def validate_schedule(games: list[Game], teams: dict, leagues: dict,
         if skey not in slot_teams:
             slot_teams[skey] = set()
 
+    # Rule 4: bye spread <= 1 (only non-blackout byes count)
+    # A bye = team was available in a slot but had no game (scheduled or
+    # unscheduled). Both rules share the same per-slot bye set, so the
+    # availability scan is done once here for both.
+    team_bye_counts: dict[str, int] = defaultdict(int)
     for skey, playing in slot_teams.items():
         week, block = skey
-        dates = slot_dates.get(skey, [])
+        dates = slot_dates.get(skey)
         if not dates:
             continue
-        # Determine which teams were available in this slot
-        available = set()
-        for t in teams:
-            team_obj = teams[t]
-            league = leagues[team_obj.league_code]
+        # Leagues blacked out on every date of the slot, evaluated once per
+        # league instead of once per team
+        blacked_out = {lcode for lcode, bo in league_blackout.items()
+                       if bo >= dates}
+        # Exclude teams with unscheduled games — they're not on bye
+        unsched_in_slot = unsched_slot_teams.get(skey, set())
+        bye_teams = []
+        for t, team_obj in teams.items():
+            if t in playing or t in unsched_in_slot:
+                continue
             # Skip weekday-only teams for weekend slots
             if block == "weekend" and team_obj.weekday_only:
-                if not any(d in team_obj.available_weekends for d in dates):
+                if team_weekends[t].isdisjoint(dates):
                     continue
             # Skip blacked-out teams
-            if all(league.is_blacked_out(d) for d in dates):
+            if team_obj.league_code in blacked_out:
                 continue
-            available.add(t)
-        # Exclude teams with unscheduled games — they're not on bye
-        bye_teams = available - playing - unsched_slot_teams.get(skey, set())
+            # This team was available but didn't play — it's a bye
+            bye_teams.append(t)
+            team_bye_counts[t] += 1
         if len(bye_teams) > 1:
             errors.append(
                 f"Week {week} {block}: {len(bye_teams)} teams have byes "
                 f"({', '.join(sorted(bye_teams))}), max is 1"
             )
 
-    # Rule 4: bye spread <= 1 (only non-blackout byes count)
-    # A bye = team was available in a slot but had no game (scheduled or unscheduled)
-    team_bye_counts: dict[str, int] = defaultdict(int)
-    for skey in slot_teams:
-        week, block = skey
-        dates = slot_dates.get(skey, [])
-        if not dates:
-            continue
-        playing = slot_teams[skey]
-        unsched_in_slot = unsched_slot_teams.get(skey, set())
-        for t in teams:
-            if t in playing or t in unsched_in_slot:
-                continue
-            team_obj = teams[t]
-            league = leagues[team_obj.league_code]
-            if block == "weekend" and team_obj.weekday_only:
-                if not any(d in team_obj.available_weekends for d in dates):
-                    continue
-            if all(league.is_blacked_out(d) for d in dates):
-                continue
-            # This team was available but didn't play — it's a bye
-            team_bye_counts[t] += 1
-
     if team_bye_counts:
-        min_byes = min(team_bye_counts.get(t, 0) for t in teams)
-        max_byes = max(team_bye_counts.get(t, 0) for t in teams)
+        # Teams that never had a bye are missing from team_bye_counts, so
+        # the minimum is 0 unless every team had at least one
+        max_byes = max(team_bye_counts.values())
+        min_byes = (min(team_bye_counts.values())
+                    if len(team_bye_counts) == len(teams) else 0)
         if max_byes - min_byes > 1:
             over_teams = [
-                f"{t}({team_bye_counts.get(t, 0)})"
-                for t in sorted(teams)
-                if team_bye_counts.get(t, 0) > min_byes + 1
+                f"{t}({n})"
+                for t, n in sorted(team_bye_counts.items())
+                if n > min_byes + 1
             ]
             errors.append(
                 f"Bye spread {max_byes - min_byes} exceeds limit of 1: "
@@ -284,23 +337,27 @@ def validate_schedule(games: list[Game], teams: dict, leagues: dict,
                 f"Over limit: {', '.join(over_teams)}"
             )
 
-    # Check: matchup coverage — flag any pair that played 2+ times
-    all_team_list = sorted(teams.keys())
-    for i, t1 in enumerate(all_team_list):
-        for t2 in all_team_list[i + 1:]:
-            count = matchup_counts.get(t1, {}).get(t2, 0)
-            if count > 1:
-                # Determine if same-pool or cross-pool
-                both_north = t1 in north and t2 in north
-                both_south = t1 in south and t2 in south
-                if both_north or both_south:
-                    label = "Intra-pool pair"
-                else:
-                    label = "Cross-pool pair"
-                warnings.append(
-                    f"{label} {t1} vs {t2} played {count} times"
-                )
+    if early_exit and errors:
+        return _result(errors, warnings)
+
+    # Check: matchup coverage — flag any pair that played 2+ times.
+    # Only pairs that actually met can be repeats, so walk the observed ones.
+    for (t1, t2), count in sorted(matchup_counts.items()):
+        if count > 1:
+            # Determine if same-pool or cross-pool
+            t1_pool = team_pool.get(t1)
+            if t1_pool is not None and t1_pool == team_pool.get(t2):
+                label = "Intra-pool pair"
+            else:
+                label = "Cross-pool pair"
+            warnings.append(
+                f"{label} {t1} vs {t2} played {count} times"
+            )
+
+    return _result(errors, warnings)
+
 
+def _result(errors: list[str], warnings: list[str]) -> dict:
     return {
         "valid": len(errors) == 0,
         "errors": errors,
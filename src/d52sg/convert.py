@@ -12,13 +12,16 @@ from pathlib import Path
 
 from d52sg.config import load_config
 from d52sg.models import Game
-from d52sg.output import format_gamechanger_csv
+from d52sg.output import write_gamechanger_csv
+
+
+_TIME_12H_RE = re.compile(r'^(\d{1,2}):(\d{2})(am|pm)$')
 
 
 def _parse_time_12h(s: str) -> time:
     """Parse '5:00pm', '10:00am', '1:30pm' etc. into a time object."""
     s = s.strip().lower()
-    m = re.match(r'^(\d{1,2}):(\d{2})(am|pm)$', s)
+    m = _TIME_12H_RE.match(s)
     if not m:
         raise ValueError(f"Cannot parse time: {s!r}")
     hour, minute, period = int(m.group(1)), int(m.group(2)), m.group(3)
@@ -41,23 +44,37 @@ def parse_editable_csv(csv_path: str, config: dict) -> list[Game]:
 
     # Build field -> league lookup for host_team determination
     field_to_leagues: dict[str, list[str]] = {}
+    league_fields: dict[str, frozenset[str]] = {}
     for lcode, league in leagues.items():
         for fs in league.weekday_fields + league.weekend_fields:
             field_to_leagues.setdefault(fs.field_name, []).append(lcode)
+        league_fields[lcode] = frozenset(
+            fs.field_name
+            for fs in league.weekday_fields + league.weekend_fields)
 
     games = []
     with open(csv_path) as f:
-        reader = csv.DictReader(f)
+        # Plain csv.reader with column positions taken from the header;
+        # DictReader would build a dict for every row
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return games
+        col = {name: i for i, name in enumerate(header)}
+        i_home, i_away, i_field = col["Home"], col["Away"], col["Field"]
+        i_date, i_time = col["Date"], col["Time"]
         for row in reader:
-            home = row["Home"].strip()
-            away = row["Away"].strip()
-            field_name = row["Field"].strip()
+            if not row:
+                continue
+            home = sys.intern(row[i_home].strip())
+            away = sys.intern(row[i_away].strip())
+            field_name = row[i_field].strip()
 
             if not home or not away:
                 continue
 
             # Parse date (M/D format, infer year from season)
-            date_str = row["Date"].strip()
+            date_str = row[i_date].strip()
             parts = date_str.split("/")
             if len(parts) == 2:
                 month, day = int(parts[0]), int(parts[1])
@@ -76,7 +93,7 @@ def parse_editable_csv(csv_path: str, config: dict) -> list[Game]:
                 continue
 
             # Parse time
-            time_str = row["Time"].strip()
+            time_str = row[i_time].strip()
             try:
                 start_time = _parse_time_12h(time_str)
             except ValueError as e:
@@ -100,17 +117,9 @@ def parse_editable_csv(csv_path: str, config: dict) -> list[Game]:
             # Determine host_team from field ownership
             host_team = home  # default
             if field_name and home in teams:
-                home_league = teams[home].league_code
-                home_fields = set()
-                for fs in (leagues[home_league].weekday_fields +
-                           leagues[home_league].weekend_fields):
-                    home_fields.add(fs.field_name)
+                home_fields = league_fields[teams[home].league_code]
                 if field_name not in home_fields and away in teams:
-                    away_league = teams[away].league_code
-                    away_fields = set()
-                    for fs in (leagues[away_league].weekday_fields +
-                               leagues[away_league].weekend_fields):
-                        away_fields.add(fs.field_name)
+                    away_fields = league_fields[teams[away].league_code]
                     if field_name in away_fields:
                         host_team = away
 
@@ -169,19 +178,16 @@ def main():
         print("No games found in CSV. Check the format.")
         sys.exit(1)
 
-    # Convert to GameChanger format
-    gc_csv = format_gamechanger_csv(
-        games, config["season"]["game_length_minutes"],
-        teams=config["teams"],
-    )
-
-    # Write output
     if args.output:
         out_path = Path(args.output)
     else:
         out_path = Path(csv_path).parent / "gamechanger.csv"
 
-    out_path.write_text(gc_csv)
+    # Convert to GameChanger format
+    write_gamechanger_csv(
+        games, config["season"]["game_length_minutes"], out_path,
+        teams=config["teams"],
+    )
     print(f"Written: {out_path} ({len(games)} games)")
 
 
@@ -1,7 +1,8 @@
 """Data models for D52 scheduling app."""
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from datetime import date, time
+from datetime import date, time, timedelta
 from enum import Enum
 from typing import Optional
 
@@ -17,29 +18,42 @@ class DayOfWeek(Enum):
 
     @classmethod
     def from_str(cls, s: str) -> "DayOfWeek":
-        return cls[s[:3].capitalize()]
+        try:
+            return _DAY_MAP[s]
+        except KeyError:
+            return cls[s[:3].capitalize()]
 
+    # _value_ is the plain attribute behind the Enum.value property
     def is_weekday(self) -> bool:
-        return self.value < 5
+        return self._value_ < 5
 
     def is_weekend(self) -> bool:
-        return self.value >= 5
+        return self._value_ >= 5
 
 
 WEEKDAYS = [DayOfWeek.Mon, DayOfWeek.Tue, DayOfWeek.Wed, DayOfWeek.Thu, DayOfWeek.Fri]
 WEEKENDS = [DayOfWeek.Sat, DayOfWeek.Sun]
 
+# Exact-match lookup for the common spellings ('Mon', 'mon', 'MON',
+# 'Monday', ...); anything else falls back to the 3-letter prefix in from_str
+_DAY_MAP: dict[str, DayOfWeek] = {}
+for _day, _full in zip(DayOfWeek, ("Monday", "Tuesday", "Wednesday", "Thursday",
+                                   "Friday", "Saturday", "Sunday")):
+    for _name in (_day.name, _full):
+        _DAY_MAP[_name] = _DAY_MAP[_name.lower()] = _DAY_MAP[_name.upper()] = _day
+del _day, _full, _name
 
-@dataclass
+
+@dataclass(slots=True)
 class FieldSlot:
     """A specific field/time that a league can use for home games."""
     field_name: str
     day: DayOfWeek
     start_time: time
-    exclude_dates: list[date] = field(default_factory=list)
+    exclude_dates: list[date] = field(default_factory=list)  # sorted, unique
 
 
-@dataclass
+@dataclass(slots=True)
 class League:
     """A local league with one or more teams."""
     code: str
@@ -49,6 +63,22 @@ class League:
     weekday_fields: list[FieldSlot] = field(default_factory=list)
     weekend_fields: list[FieldSlot] = field(default_factory=list)
     blackout_ranges: list[tuple[date, date]] = field(default_factory=list)
+    # Start dates of blackout_ranges, for bisect lookups in is_blacked_out
+    _blackout_starts: list[date] = field(init=False, repr=False,
+                                         compare=False, default_factory=list)
+
+    def __post_init__(self):
+        # Canonicalize: sort and merge overlapping/adjacent ranges so each
+        # date falls in at most one range
+        merged: list[tuple[date, date]] = []
+        for start, end in sorted(self.blackout_ranges):
+            if merged and start <= merged[-1][1] + timedelta(days=1):
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        self.blackout_ranges = merged
+        self._blackout_starts = [start for start, _ in merged]
 
     @property
     def weekday_home_cap(self) -> int:
@@ -61,10 +91,11 @@ class League:
         return len(self.weekend_fields)
 
     def is_blacked_out(self, d: date) -> bool:
-        return any(start <= d <= end for start, end in self.blackout_ranges)
+        i = bisect_right(self._blackout_starts, d) - 1
+        return i >= 0 and d <= self.blackout_ranges[i][1]
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """A team in the league."""
     code: str
@@ -76,7 +107,7 @@ class Team:
     gamechanger_name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Matchup:
     """A pairing of two teams (no home/away yet)."""
     team_a: str
@@ -91,7 +122,7 @@ class Matchup:
         return self.team_a
 
 
-@dataclass
+@dataclass(slots=True)
 class Round:
     """A set of matchups where each team plays at most once."""
     number: int
@@ -100,7 +131,7 @@ class Round:
     bye_teams: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     """A fully scheduled game with date, time, field, and home/away."""
     home_team: str
@@ -118,7 +149,7 @@ class Game:
     game_source: str = ""  # "round", "deferred", "safe_adhoc", "adhoc"
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarSlot:
     """A scheduling slot: one weekday period or one weekend period in a week."""
     week_number: int
@@ -127,3 +158,7 @@ class CalendarSlot:
     available_teams: set[str] = field(default_factory=set)
     assigned_round: Optional[int] = None
     games: list[Game] = field(default_factory=list)
+    # (Matchup, round_number, source) entries, attached by the scheduler
+    # while assigning rounds; left unset until then
+    _pending_matchups: list[tuple] = field(init=False, repr=False,
+                                           compare=False)
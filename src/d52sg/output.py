@@ -1,107 +1,184 @@
 """Output formatters for D52 scheduling app."""
 
 import csv
+import re
+from collections import defaultdict
 from datetime import date, time
+from functools import lru_cache
 from io import StringIO
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from d52sg.models import Game
 
 
+# Sort/group keys (C-level attrgetter instead of per-call lambdas)
+_KEY_WEEK = attrgetter("week_number")
+_KEY_DATE = attrgetter("date")
+_KEY_WEEK_DATE_TIME = attrgetter("week_number", "date", "start_time")
+_KEY_DATE_TIME = attrgetter("date", "start_time")
+_KEY_DATE_TIME_HOME = attrgetter("date", "start_time", "home_team")
+
+_RULE = "=" * 80
+_SCHEDULE_HEADER = f"{_RULE}\nD52 JUNIORS 54/80 SCHEDULE\n{_RULE}"
+
+
+# A season has only a few dozen distinct dates and start times, so the
+# per-game formatting below is cached rather than redone for every game.
+
+@lru_cache(maxsize=None)
+def _fmt_date(d: date, fmt: str) -> str:
+    return d.strftime(fmt)
+
+
+@lru_cache(maxsize=None)
+def _fmt_start(t: time) -> str:
+    """Format a start time as e.g. '5:30pm'."""
+    return t.strftime("%-I:%M%p").lower()
+
+
+@lru_cache(maxsize=None)
+def _fmt_hm(t: time) -> str:
+    """Format a time as 24-hour 'H:MM' for GameChanger."""
+    return f"{t.hour}:{t.minute:02d}"
+
+
+def _split_games(games: list[Game]) -> tuple[list[Game], list[Game]]:
+    """Split games into (scheduled, unscheduled) in one pass.
+
+    The scheduled list comes back sorted by (date, start_time), which every
+    formatter either wants directly or only needs to refine within ties, so
+    their own sorts are near-linear on it.
+    """
+    scheduled = []
+    unscheduled = []
+    for g in games:
+        (unscheduled if g.unscheduled else scheduled).append(g)
+    scheduled.sort(key=_KEY_DATE_TIME)
+    return scheduled, unscheduled
+
+
 def format_schedule(games: list[Game], teams: dict) -> str:
     """Format schedule as human-readable text, organized by week."""
-    scheduled = [g for g in games if not g.unscheduled]
-    unscheduled = [g for g in games if g.unscheduled]
+    return _format_schedule(*_split_games(games))
 
-    lines = []
-    lines.append("=" * 80)
-    lines.append("D52 JUNIORS 54/80 SCHEDULE")
-    lines.append("=" * 80)
 
-    # Group by week
-    by_week: dict[int, list[Game]] = {}
-    for g in scheduled:
-        by_week.setdefault(g.week_number, []).append(g)
-
-    for week_num in sorted(by_week.keys()):
-        week_games = sorted(by_week[week_num], key=lambda g: (g.date, g.start_time))
-        lines.append(f"\n--- WEEK {week_num} ---")
-
-        # Group by date within week
-        by_date: dict[date, list[Game]] = {}
-        for g in week_games:
-            by_date.setdefault(g.date, []).append(g)
-
-        for d in sorted(by_date.keys()):
-            day_name = d.strftime("%A")
-            lines.append(f"\n  {day_name} {d.strftime('%m/%d/%Y')}")
-            for g in sorted(by_date[d], key=lambda x: x.start_time):
-                start = g.start_time.strftime("%-I:%M%p").lower()
+def _format_schedule(scheduled: list[Game], unscheduled: list[Game]) -> str:
+    buf = StringIO()
+    buf.write(_SCHEDULE_HEADER)
+
+    def emit(line: str):
+        buf.write("\n")
+        buf.write(line)
+
+    # Sort once; weeks, dates within a week and games within a date are then
+    # consecutive runs of the sorted list
+    scheduled = sorted(scheduled, key=_KEY_WEEK_DATE_TIME)
+
+    for week_num, week_games in groupby(scheduled, key=_KEY_WEEK):
+        emit(f"\n--- WEEK {week_num} ---")
+
+        for d, day_games in groupby(week_games, key=_KEY_DATE):
+            emit(f"\n  {_fmt_date(d, '%A %m/%d/%Y')}")
+            for g in day_games:
+                start = _fmt_start(g.start_time)
                 host_note = ""
                 if g.host_team != g.home_team:
                     host_note = f" (at {g.host_team})"
                 game_type = "X" if g.game_type == "crossover" else " "
-                lines.append(
+                emit(
                     f"    [{game_type}] {start:>7}  {g.home_team:<6} vs {g.away_team:<6}  "
                     f"@ {g.field_name}{host_note}"
                 )
 
     # Unscheduled games section
     if unscheduled:
-        lines.append(f"\n{'=' * 80}")
-        lines.append(f"UNSCHEDULED GAMES ({len(unscheduled)})")
-        lines.append("=" * 80)
+        emit(f"\n{_RULE}")
+        emit(f"UNSCHEDULED GAMES ({len(unscheduled)})")
+        emit(_RULE)
         for g in unscheduled:
             gt = "X" if g.game_type == "crossover" else " "
-            lines.append(
+            emit(
                 f"  [{gt}] {g.home_team:<6} vs {g.away_team:<6}  (Week {g.week_number} {'WD' if g.slot_type == 'weekday' else 'WE'})"
             )
 
     # Per-team schedule
-    lines.append("\n" + "=" * 80)
-    lines.append("PER-TEAM SCHEDULES")
-    lines.append("=" * 80)
+    emit(f"\n{_RULE}")
+    emit("PER-TEAM SCHEDULES")
+    emit(_RULE)
 
-    by_team: dict[str, list[Game]] = {}
+    # scheduled is already in date order, so each team's list is too
+    by_team: dict[str, list[Game]] = defaultdict(list)
     for g in scheduled:
-        by_team.setdefault(g.home_team, []).append(g)
-        by_team.setdefault(g.away_team, []).append(g)
+        by_team[g.home_team].append(g)
+        by_team[g.away_team].append(g)
 
     # Also track unscheduled per team
-    unsched_by_team: dict[str, list[Game]] = {}
+    unsched_by_team: dict[str, list[Game]] = defaultdict(list)
     for g in unscheduled:
-        unsched_by_team.setdefault(g.home_team, []).append(g)
-        unsched_by_team.setdefault(g.away_team, []).append(g)
+        unsched_by_team[g.home_team].append(g)
+        unsched_by_team[g.away_team].append(g)
 
-    all_team_codes = sorted(set(list(by_team.keys()) + list(unsched_by_team.keys())))
+    all_team_codes = sorted(by_team.keys() | unsched_by_team.keys())
     for team_code in all_team_codes:
-        team_games = sorted(by_team.get(team_code, []), key=lambda g: g.date)
-        lines.append(f"\n{team_code}:")
+        team_games = by_team.get(team_code, [])
+        emit(f"\n{team_code}:")
         for i, g in enumerate(team_games, 1):
             is_home = g.home_team == team_code
             opponent = g.away_team if is_home else g.home_team
             h_a = "H" if is_home else "V"
-            day = g.date.strftime("%a %m/%d")
-            start = g.start_time.strftime("%-I:%M%p").lower()
+            day = _fmt_date(g.date, "%a %m/%d")
+            start = _fmt_start(g.start_time)
             gt = "X" if g.game_type == "crossover" else " "
-            lines.append(
+            emit(
                 f"  {i:>2}. {day} {start:>7} {h_a} vs {opponent:<6} "
                 f"@ {g.field_name} [{gt}]"
             )
         for g in unsched_by_team.get(team_code, []):
             opponent = g.away_team if g.home_team == team_code else g.home_team
             gt = "X" if g.game_type == "crossover" else " "
-            lines.append(
+            emit(
                 f"      UNSCHEDULED    vs {opponent:<6}  (Week {g.week_number} {'WD' if g.slot_type == 'weekday' else 'WE'}) [{gt}]"
             )
 
-    return "\n".join(lines)
+    return buf.getvalue()
+
+
+# Unused GameChanger columns: Title..Tags, and Team2_Division_ID onwards
+_GC_BLANK_8 = ("",) * 8
+_GC_BLANK_12 = ("",) * 12
+
+# Rows are written as plain joined strings when that is exactly what
+# csv.writer would produce: the row has only its separating commas and no
+# quote or line-break characters. Anything else goes through csv.writer.
+_CSV_QUOTE_CHARS = re.compile(r'["\r\n]')
+_GC_COMMAS = 27  # 28 columns
+_EDIT_COMMAS = 6  # 7 columns
 
 
 def format_gamechanger_csv(games: list[Game], game_length: int,
                            teams: dict | None = None) -> str:
     """Format schedule as GameChanger upload CSV."""
     output = StringIO()
-    writer = csv.writer(output)
+    _write_gamechanger_csv(output, _split_games(games)[0], teams)
+    return output.getvalue()
+
+
+def write_gamechanger_csv(games: list[Game], game_length: int,
+                          path: str | Path, teams: dict | None = None, *,
+                          scheduled: list[Game] | None = None):
+    """Write the GameChanger upload CSV straight to path.
+
+    scheduled, if given, is games already split out by _split_games.
+    """
+    if scheduled is None:
+        scheduled = _split_games(games)[0]
+    with open(path, "w", newline="") as f:
+        _write_gamechanger_csv(f, scheduled, teams)
+
+
+def _write_gamechanger_csv(f, scheduled: list[Game], teams: dict | None):
+    writer = csv.writer(f)
 
     # Header
     writer.writerow([
@@ -116,30 +193,36 @@ def format_gamechanger_csv(games: list[Game], game_length: int,
         "Division_Override",
     ])
 
-    def _gc_name(code: str) -> str:
-        if teams and code in teams and teams[code].gamechanger_name:
-            return teams[code].gamechanger_name
-        return code
+    # GameChanger display names; codes without one map to themselves
+    gc_names = {code: t.gamechanger_name or code
+                for code, t in (teams or {}).items()}
 
-    for g in sorted((g for g in games if not g.unscheduled),
-                     key=lambda x: (x.date, x.start_time)):
-        start_date = g.date.strftime("%-m/%-d/%y")
-        start_time = f"{g.start_time.hour}:{g.start_time.minute:02d}"
+    # Already in (date, start_time) order, see _split_games
+    for g in scheduled:
+        start_date = _fmt_date(g.date, "%-m/%-d/%y")
+        start_time = _fmt_hm(g.start_time)
         end_date = start_date
-        end_time = f"{g.end_time.hour}:{g.end_time.minute:02d}"
-
-        writer.writerow([
+        end_time = _fmt_hm(g.end_time)
+
+        home = gc_names.get(g.home_team, g.home_team)
+        away = gc_names.get(g.away_team, g.away_team)
+
+        line = (f"{start_date},{start_time},{end_date},{end_time},,,,,,,,,"
+                f"{home},,,{away},,,,,,,,,,,,\r\n")
+        if (line.count(",") == _GC_COMMAS
+                and not _CSV_QUOTE_CHARS.search(line, 0, len(line) - 2)):
+            f.write(line)
+            continue
+        writer.writerow((
             start_date, start_time, end_date, end_time,
-            "", "", "", "", "", "", "", "",
-            _gc_name(g.home_team), "", "",
-            _gc_name(g.away_team), "", "",
-            "", "", "",
-            "", "", "", "", "", "", "",
-        ])
-
-    return output.getvalue()
+            *_GC_BLANK_8,
+            home, "", "",
+            away,
+            *_GC_BLANK_12,
+        ))
 
 
+@lru_cache(maxsize=None)
 def _fmt_time_12h(t: time) -> str:
     """Format a time as 12-hour with am/pm (e.g., '5:00pm', '10:00am')."""
     h = t.hour
@@ -161,22 +244,43 @@ def format_editable_csv(games: list[Game],
     Columns: Game, Date, Day, Time, Home, Away, Field
     """
     output = StringIO()
-    writer = csv.writer(output)
+    _write_editable_csv(output, _split_games(games)[0], game_code_prefix)
+    return output.getvalue()
+
+
+def write_editable_csv(games: list[Game], path: str | Path,
+                       game_code_prefix: str = "G", *,
+                       scheduled: list[Game] | None = None):
+    """Write the editable CSV straight to path.
+
+    scheduled, if given, is games already split out by _split_games.
+    """
+    if scheduled is None:
+        scheduled = _split_games(games)[0]
+    with open(path, "w", newline="") as f:
+        _write_editable_csv(f, scheduled, game_code_prefix)
+
+
+def _write_editable_csv(f, scheduled: list[Game], game_code_prefix: str):
+    writer = csv.writer(f)
     writer.writerow(["Game", "Date", "Day", "Time", "Home", "Away", "Field"])
 
-    scheduled = sorted((g for g in games if not g.unscheduled),
-                       key=lambda g: (g.date, g.start_time, g.home_team))
+    scheduled = sorted(scheduled, key=_KEY_DATE_TIME_HOME)
 
     for i, g in enumerate(scheduled, 1):
         code = f"{game_code_prefix}{i}"
-        date_str = g.date.strftime("%-m/%-d")
-        day_str = g.date.strftime("%a")
+        date_str = _fmt_date(g.date, "%-m/%-d")
+        day_str = _fmt_date(g.date, "%a")
         time_str = _fmt_time_12h(g.start_time)
+        line = (f"{code},{date_str},{day_str},{time_str},"
+                f"{g.home_team},{g.away_team},{g.field_name}\r\n")
+        if (line.count(",") == _EDIT_COMMAS
+                and not _CSV_QUOTE_CHARS.search(line, 0, len(line) - 2)):
+            f.write(line)
+            continue
         writer.writerow([code, date_str, day_str, time_str,
                          g.home_team, g.away_team, g.field_name])
 
-    return output.getvalue()
-
 
 def write_schedule(games: list[Game], teams: dict,
                    game_length: int, output_prefix: str = "output",
@@ -185,20 +289,23 @@ def write_schedule(games: list[Game], teams: dict,
     out_dir = Path(output_prefix)
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    # Split once and share it across all three outputs
+    scheduled, unscheduled = _split_games(games)
+
     # Human-readable schedule
-    schedule_text = format_schedule(games, teams)
+    schedule_text = _format_schedule(scheduled, unscheduled)
     schedule_path = out_dir / "schedule.txt"
     schedule_path.write_text(schedule_text)
     print(f"Written: {schedule_path}")
 
     # GameChanger CSV
-    csv_text = format_gamechanger_csv(games, game_length, teams=teams)
     csv_path = out_dir / "gamechanger.csv"
-    csv_path.write_text(csv_text)
+    write_gamechanger_csv(games, game_length, csv_path, teams,
+                          scheduled=scheduled)
     print(f"Written: {csv_path}")
 
     # Editable CSV
-    edit_csv = format_editable_csv(games, game_code_prefix=game_code_prefix)
     edit_path = out_dir / "schedule_edit.csv"
-    edit_path.write_text(edit_csv)
+    write_editable_csv(games, edit_path, game_code_prefix,
+                       scheduled=scheduled)
     print(f"Written: {edit_path}")
@@ -1,24 +1,40 @@
 """HTML schedule formatter for D52 scheduling app."""
 
+import io
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import date, time
 from html import escape
+from operator import attrgetter
 from pathlib import Path
 
 from d52sg.models import Game
 
 
+# 24-hour clock hour -> 12-hour clock hour
+_HOUR12 = (12, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11,
+           12, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11)
+
+
+class _RenderCache(dict):
+    """Per-render memo: a missing key is computed with fn and stored."""
+    __slots__ = ("_fn",)
+
+    def __init__(self, fn):
+        super().__init__()
+        self._fn = fn
+
+    def __missing__(self, key):
+        value = self[key] = self._fn(key)
+        return value
+
+
 def _fmt_time(t: time) -> str:
     h = t.hour
-    m = t.minute
     suffix = "am" if h < 12 else "pm"
-    if h == 0:
-        h = 12
-    elif h > 12:
-        h -= 12
-    if m == 0:
-        return f"{h}{suffix}"
-    return f"{h}:{m:02d}{suffix}"
+    if t.minute:
+        return f"{_HOUR12[h]}:{t.minute:02d}{suffix}"
+    return f"{_HOUR12[h]}{suffix}"
 
 
 def _fmt_date(d: date) -> str:
@@ -34,13 +50,15 @@ CROSS_EMOJI = "\U0001F697"  # red car
 INTRA_EMOJI = "\U0001F6B6\u200D\u2642\uFE0F"  # walking man
 
 
-def _round_label(game: Game, pools: dict) -> str:
+def _round_label(game: Game, north: frozenset[str]) -> str:
     """Round label with pool prefix and source indicator.
 
     - Regular round game: n1, s4, x10
     - Deferred (blackout recovery): n1, s4, x10 (same label, different slot)
     - Safe ad-hoc (from overflow round): n1*, s4*, x10*
     - Truly ad-hoc (invented pairing): AH
+
+    ``north`` is the set of north-pool team codes.
     """
     source = game.game_source
     if source == "adhoc" or (game.round_number == 0 and not source):
@@ -48,7 +66,6 @@ def _round_label(game: Game, pools: dict) -> str:
     if game.game_type == "crossover":
         label = f"x{game.round_number}"
     else:
-        north = set(pools.get("north", []))
         prefix = "n" if game.home_team in north else "s"
         label = f"{prefix}{game.round_number}"
     if source == "safe_adhoc":
@@ -67,6 +84,57 @@ def _fmt_field(field_name: str, field_info: dict) -> str:
     return escaped
 
 
+@dataclass(slots=True)
+class _GameRow:
+    """A scheduled game plus the per-render data attached to it."""
+    game: Game
+    code: str = ""  # sequential game code (G1, G2, ...)
+    slot: str = ""  # "weekday" or "weekend"
+    round_label: str = ""
+
+
+@dataclass(slots=True)
+class _SlotBucket:
+    """Everything the HTML render needs for one (week_number, slot_type)."""
+    rows: list[_GameRow] = field(default_factory=list)
+    unsched: list[Game] = field(default_factory=list)
+    unsched_teams: set[str] = field(default_factory=set)
+    dates: list[date] = field(default_factory=list)  # sorted, distinct
+
+
+# _GameRow sort keys (C-level attrgetter instead of per-call lambdas)
+_KEY_DATE_TIME = attrgetter("game.date", "game.start_time")
+_KEY_DATE_TIME_HOME = attrgetter("game.date", "game.start_time",
+                                 "game.home_team")
+
+
+# Row templates for the master and per-team schedule tables, filled with
+# str.format_map so each row is a single formatting call
+_MASTER_ROW = ('<tr><td>{gcode}</td><td class="game-type">{emoji}</td>'
+               '<td>{time}</td><td class="home">{home}</td><td>vs</td>'
+               '<td>{away}</td><td>{field}{host_note}</td>'
+               '<td{rnd_style}>{rnd}</td></tr>')
+_MASTER_UNSCHED_ROW = ('<tr style="background:#f8d7da"><td></td>'
+                       '<td class="game-type">{emoji}</td><td>UNSCHED</td>'
+                       '<td class="home">{home}</td><td>vs</td>'
+                       '<td>{away}</td><td colspan="2"></td></tr>')
+_TEAM_ROW = ('<tr><td>{gcode}</td><td>{num}</td><td>W{wk} {slot}</td>'
+             '<td>{date}</td><td>{time}</td><td class="{ha_cls}">{ha}</td>'
+             '<td>{host}</td><td>{opponent}</td><td>{field}</td>'
+             '<td{rnd_style}>{rnd}</td></tr>')
+
+# Matrix cells: the zero and diagonal cases dominate and are constant;
+# counts of 1 and 2+ fill a %-template (index min(count, 2))
+_EMPTY_CELL = '<td class="matrix-cell">0</td>'
+_UNUSED_CELL = '<td class="matrix-cell" style="color:#ccc">0</td>'
+_DIAG_CELL = '<td class="matrix-cell" style="color:#ccc">&ndash;</td>'
+_NONZERO_CELL = (
+    None,
+    '<td class="matrix-cell" style="background:#d4edda">%d</td>',
+    '<td class="matrix-cell" style="background:#f8d7da">%d</td>',
+)
+
+
 CSS = """\
 body {
   font-family: -apple-system, "Segoe UI", Helvetica, Arial, sans-serif;
@@ -136,6 +204,18 @@ pre {
 .blackout { color: #999; font-style: italic; }
 """
 
+# Document preamble up to and including <body>, with the stylesheet baked
+# in at import time; only the title varies per render
+_HEAD_TMPL = ('<!DOCTYPE html>\n'
+              '<html lang="en"><head>\n'
+              '<meta charset="utf-8">\n'
+              '<meta name="viewport" '
+              'content="width=device-width, initial-scale=1">\n'
+              '<title>{title}</title>\n'
+              '<style>' + CSS.replace("{", "{{").replace("}", "}}") +
+              '</style>\n'
+              '</head><body>\n')
+
 
 def format_schedule_html(games: list[Game], teams: dict, leagues: dict,
                          field_info: dict | None = None,
@@ -152,23 +232,36 @@ def format_schedule_html(games: list[Game], teams: dict, leagues: dict,
     scheduled = [g for g in games if not g.unscheduled]
     unscheduled = [g for g in games if g.unscheduled]
 
-    # Assign sequential game codes (G1, G2, ...) sorted by date/time
-    sorted_games = sorted(scheduled, key=lambda g: (g.date, g.start_time,
-                                                 g.home_team))
-    game_codes: dict[int, str] = {}  # id(game) -> code string
-    for i, g in enumerate(sorted_games, 1):
-        game_codes[id(g)] = f"{game_code_prefix}{i}"
-
-    parts = []
-    parts.append("<!DOCTYPE html>")
-    parts.append('<html lang="en"><head>')
-    parts.append('<meta charset="utf-8">')
-    parts.append('<meta name="viewport" content="width=device-width, initial-scale=1">')
-    parts.append(f"<title>{escape(title)}</title>")
-    parts.append(f"<style>{CSS}</style>")
-    parts.append("</head><body>")
-
-    parts.append(f"<h1>{escape(title)}</h1>")
+    # Assign sequential game codes (G1, G2, ...) sorted by date/time; the
+    # rows keep scheduled order so ties render as before
+    north = frozenset(pools.get("north", ()))
+    rows = [_GameRow(g,
+                     slot="weekend" if g.date.weekday() >= 5 else "weekday",
+                     round_label=_round_label(g, north))
+            for g in scheduled]
+    sorted_rows = sorted(rows, key=_KEY_DATE_TIME_HOME)
+    for i, row in enumerate(sorted_rows, 1):
+        row.code = f"{game_code_prefix}{i}"
+
+    # Team codes and start times repeat across every section; escape and
+    # format each distinct value once. Games edited by hand may name teams
+    # missing from teams, so codes are escaped on first use.
+    esc_team = _RenderCache(escape)
+    esc_league = {lc: escape(league.full_name) for lc, league in leagues.items()}
+    time_html = _RenderCache(_fmt_time)
+    field_html_cache = {name: _fmt_field(name, field_info)
+                        for name in {g.field_name for g in scheduled}}
+
+    buf = io.StringIO()
+
+    def emit(line: str):
+        buf.write(line)
+        buf.write("\n")
+
+    esc_title = escape(title)
+    buf.write(_HEAD_TMPL.format(title=esc_title))
+
+    emit(f"<h1>{esc_title}</h1>")
 
     if scheduled:
         first = min(g.date for g in scheduled)
@@ -176,18 +269,18 @@ def format_schedule_html(games: list[Game], teams: dict, leagues: dict,
         count_str = f'{len(scheduled)} games'
         if unscheduled:
             count_str += f' + {len(unscheduled)} unscheduled'
-        parts.append(f'<p class="subtitle">{first.strftime("%B %-d")} &ndash; '
-                     f'{last.strftime("%B %-d, %Y")} &middot; '
-                     f'{count_str}</p>')
+        emit(f'<p class="subtitle">{first.strftime("%B %-d")} &ndash; '
+             f'{last.strftime("%B %-d, %Y")} &middot; '
+             f'{count_str}</p>')
 
-    parts.append(f'<p class="legend">'
-                 f'{CROSS_EMOJI} = crossover (north vs south) &nbsp; '
-                 f'{INTRA_EMOJI} = intra-pool &nbsp; '
-                 f'\U0001F3E0 = hosting</p>')
+    emit(f'<p class="legend">'
+         f'{CROSS_EMOJI} = crossover (north vs south) &nbsp; '
+         f'{INTRA_EMOJI} = intra-pool &nbsp; '
+         f'\U0001F3E0 = hosting</p>')
 
     # Table of contents
-    parts.append('<h2 id="toc">Contents</h2>')
-    parts.append('<div class="toc">')
+    emit('<h2 id="toc">Contents</h2>')
+    emit('<div class="toc">')
 
     # Group leagues by pool for the TOC
     for pool_name in ("north", "south"):
@@ -201,213 +294,190 @@ def format_schedule_html(games: list[Game], teams: dict, leagues: dict,
             if lc not in seen:
                 seen.add(lc)
                 pool_leagues.append(lc)
-        parts.append(f'<p style="margin-top:8px"><strong>'
-                     f'{pool_name.title()} Pool</strong></p>')
+        emit(f'<p style="margin-top:8px"><strong>'
+             f'{pool_name.title()} Pool</strong></p>')
         for lc in sorted(pool_leagues):
-            league = leagues[lc]
-            parts.append(f'<p><a href="#league-{lc}">'
-                         f'{escape(league.full_name)}</a></p>')
+            emit(f'<p><a href="#league-{lc}">{esc_league[lc]}</a></p>')
 
     # Fallback if no pools provided — flat list
     if not pools:
         for league_code in sorted(leagues.keys()):
-            league = leagues[league_code]
-            parts.append(f'<p><a href="#league-{league_code}">'
-                         f'{escape(league.full_name)}</a></p>')
+            emit(f'<p><a href="#league-{league_code}">'
+                 f'{esc_league[league_code]}</a></p>')
 
     if unscheduled:
-        parts.append(f'<p style="margin-top:8px">'
-                     f'<a href="#unscheduled" style="color:#c00">'
-                     f'Unscheduled Games ({len(unscheduled)})</a></p>')
+        emit(f'<p style="margin-top:8px">'
+             f'<a href="#unscheduled" style="color:#c00">'
+             f'Unscheduled Games ({len(unscheduled)})</a></p>')
 
     if validation_result or stats:
-        parts.append(f'<p style="margin-top:8px">'
-                     f'<a href="#stats">Schedule Statistics</a></p>')
+        emit(f'<p style="margin-top:8px">'
+             f'<a href="#stats">Schedule Statistics</a></p>')
 
-    parts.append("</div>")
+    emit("</div>")
 
     # --- Master schedule ---
-    parts.append('<h2 id="master">Full Schedule</h2>')
-
-    # Group games by (week_number, slot) where slot is weekday or weekend
-    all_team_codes = sorted(teams.keys())
-    by_slot: dict[tuple[int, str], list[Game]] = defaultdict(list)
-    week_numbers = set()
-    for g in scheduled:
-        slot_type = "weekend" if g.date.weekday() >= 5 else "weekday"
-        by_slot[(g.week_number, slot_type)].append(g)
-        week_numbers.add(g.week_number)
-
-    # Index unscheduled games by (week_number, slot_type)
-    unsched_by_slot: dict[tuple[int, str], list[Game]] = defaultdict(list)
-    unsched_teams_by_slot: dict[tuple[int, str], set[str]] = defaultdict(set)
+    emit('<h2 id="master">Full Schedule</h2>')
+
+    # Group games by (week_number, slot) where slot is weekday or weekend,
+    # and by team, in one pass over each list
+    slots: dict[tuple[int, str], _SlotBucket] = defaultdict(_SlotBucket)
+    by_team: dict[str, list[_GameRow]] = defaultdict(list)
+    for row in rows:
+        g = row.game
+        bucket = slots[(g.week_number, row.slot)]
+        bucket.rows.append(row)
+        bucket.dates.append(g.date)
+        by_team[g.home_team].append(row)
+        by_team[g.away_team].append(row)
+
+    unsched_by_team: dict[str, list[Game]] = defaultdict(list)
     for g in unscheduled:
-        st = g.slot_type if g.slot_type else "weekend"
-        unsched_by_slot[(g.week_number, st)].append(g)
-        unsched_teams_by_slot[(g.week_number, st)].add(g.home_team)
-        unsched_teams_by_slot[(g.week_number, st)].add(g.away_team)
-        week_numbers.add(g.week_number)
+        bucket = slots[(g.week_number,
+                        g.slot_type if g.slot_type else "weekend")]
+        bucket.unsched.append(g)
+        bucket.unsched_teams.add(g.home_team)
+        bucket.unsched_teams.add(g.away_team)
+        unsched_by_team[g.home_team].append(g)
+        unsched_by_team[g.away_team].append(g)
 
-    for week_num in sorted(week_numbers):
+    # Sorted dates per slot, shared by the master headers and per-team
+    # blackout checks
+    for bucket in slots.values():
+        bucket.dates = sorted(set(bucket.dates))
+
+    # Every (week_number, slot_type) in the schedule, including slots that
+    # only have unscheduled games
+    all_slots = sorted(slots)
+    week_numbers = sorted({wk for wk, _ in all_slots})
+
+    for week_num in week_numbers:
         for slot_type, slot_label in [("weekday", "Weekday"),
                                       ("weekend", "Weekend")]:
-            key = (week_num, slot_type)
-            slot_games = sorted(by_slot.get(key, []),
-                                key=lambda g: (g.date, g.start_time))
-            if not slot_games:
+            bucket = slots.get((week_num, slot_type))
+            if bucket is None or not bucket.rows:
                 continue
+            slot_rows = sorted(bucket.rows, key=_KEY_DATE_TIME)
 
             # Date range for this sub-header
-            dates = sorted({g.date for g in slot_games})
+            dates = bucket.dates
             if len(dates) == 1:
                 date_range = dates[0].strftime("%-m/%-d")
             else:
                 date_range = (f"{dates[0].strftime('%-m/%-d')}"
                               f"&ndash;{dates[-1].strftime('%-m/%-d')}")
 
-            parts.append(f"<h3>Week {week_num} &mdash; {slot_label} "
-                         f"({date_range})</h3>")
-            parts.append("<table>")
-            parts.append("<tr><th>Game</th><th></th><th>Time</th><th>Home</th>"
-                         "<th></th><th>Visitor</th><th>Field</th>"
-                         "<th>R#</th></tr>")
+            emit(f"<h3>Week {week_num} &mdash; {slot_label} "
+                 f"({date_range})</h3>")
+            emit("<table>")
+            emit("<tr><th>Game</th><th></th><th>Time</th><th>Home</th>"
+                 "<th></th><th>Visitor</th><th>Field</th>"
+                 "<th>R#</th></tr>")
 
             prev_date = None
-            for g in slot_games:
+            for row in slot_rows:
+                g = row.game
                 if g.date != prev_date:
                     day_label = g.date.strftime("%A %-m/%-d")
-                    parts.append(f'<tr><td colspan="8" class="day-header">'
-                                 f'{day_label}</td></tr>')
+                    emit(f'<tr><td colspan="8" class="day-header">'
+                         f'{day_label}</td></tr>')
                     prev_date = g.date
 
                 gtype_emoji = CROSS_EMOJI if g.game_type == "crossover" else INTRA_EMOJI
                 host_note = ""
                 if g.host_team != g.home_team:
-                    host_note = f' <span style="color:red">(at {escape(g.host_team)})</span>'
+                    host_note = f' <span style="color:red">(at {esc_team[g.host_team]})</span>'
 
-                field_html = _fmt_field(g.field_name, field_info)
+                field_html = field_html_cache[g.field_name]
 
-                rnd_label = _round_label(g, pools)
+                rnd_label = row.round_label
                 rnd_style = ' style="color:#999"' if g.round_number == 0 else ""
 
-                gcode = game_codes.get(id(g), "")
-
-                parts.append(
-                    f"<tr>"
-                    f"<td>{gcode}</td>"
-                    f'<td class="game-type">{gtype_emoji}</td>'
-                    f"<td>{_fmt_time(g.start_time)}</td>"
-                    f'<td class="home">{escape(g.home_team)}</td>'
-                    f"<td>vs</td>"
-                    f"<td>{escape(g.away_team)}</td>"
-                    f"<td>{field_html}{host_note}</td>"
-                    f"<td{rnd_style}>{rnd_label}</td>"
-                    f"</tr>"
-                )
+                emit(_MASTER_ROW.format_map({
+                    "gcode": row.code,
+                    "emoji": gtype_emoji,
+                    "time": time_html[g.start_time],
+                    "home": esc_team[g.home_team],
+                    "away": esc_team[g.away_team],
+                    "field": field_html,
+                    "host_note": host_note,
+                    "rnd_style": rnd_style,
+                    "rnd": rnd_label,
+                }))
 
             # Unscheduled games in this slot (shown in red)
-            slot_unsched = unsched_by_slot.get(key, [])
+            slot_unsched = bucket.unsched
             for g in slot_unsched:
                 gtype_emoji = CROSS_EMOJI if g.game_type == "crossover" else INTRA_EMOJI
-                parts.append(
-                    f'<tr style="background:#f8d7da">'
-                    f"<td></td>"
-                    f'<td class="game-type">{gtype_emoji}</td>'
-                    f"<td>UNSCHED</td>"
-                    f'<td class="home">{escape(g.home_team)}</td>'
-                    f"<td>vs</td>"
-                    f"<td>{escape(g.away_team)}</td>"
-                    f'<td colspan="2"></td>'
-                    f"</tr>"
-                )
+                emit(_MASTER_UNSCHED_ROW.format_map({
+                    "emoji": gtype_emoji,
+                    "home": esc_team[g.home_team],
+                    "away": esc_team[g.away_team],
+                }))
 
             # BYE / Blackout rows: teams not playing in this slot
             playing = set()
-            for g in slot_games:
-                playing.add(g.home_team)
-                playing.add(g.away_team)
+            for row in slot_rows:
+                playing.add(row.game.home_team)
+                playing.add(row.game.away_team)
             # Teams with unscheduled games are NOT on bye
-            unsched_here = unsched_teams_by_slot.get(key, set())
-            not_playing = sorted(t for t in all_team_codes
-                                 if t not in playing and t not in unsched_here)
+            unsched_here = bucket.unsched_teams
+            not_playing = sorted(teams.keys() - playing - unsched_here)
+            # Blackouts are per league, so test each league once per slot
+            league_blacked_out = {
+                lc: any(leagues[lc].is_blacked_out(d) for d in dates)
+                for lc in {teams[t].league_code for t in not_playing}
+            }
             blackout_teams = []
             weekday_only_teams = []
             bye_teams = []
             for t in not_playing:
-                if slot_type == "weekend" and teams[t].weekday_only:
+                team = teams[t]
+                if slot_type == "weekend" and team.weekday_only:
                     weekday_only_teams.append(t)
+                elif league_blacked_out[team.league_code]:
+                    blackout_teams.append(t)
                 else:
-                    lc = teams[t].league_code
-                    league = leagues[lc]
-                    if any(league.is_blacked_out(d) for d in dates):
-                        blackout_teams.append(t)
-                    else:
-                        bye_teams.append(t)
+                    bye_teams.append(t)
             if blackout_teams:
-                parts.append(f'<tr class="blackout"><td colspan="8">'
-                             f'Blackout: {", ".join(blackout_teams)}</td></tr>')
+                emit(f'<tr class="blackout"><td colspan="8">'
+                     f'Blackout: {", ".join(blackout_teams)}</td></tr>')
             if weekday_only_teams:
-                parts.append(f'<tr class="blackout"><td colspan="8">'
-                             f'Weekdays Only: {", ".join(weekday_only_teams)}'
-                             f'</td></tr>')
+                emit(f'<tr class="blackout"><td colspan="8">'
+                     f'Weekdays Only: {", ".join(weekday_only_teams)}'
+                     f'</td></tr>')
             if bye_teams:
-                parts.append(f'<tr class="bye"><td colspan="8">'
-                             f'BYE: {", ".join(bye_teams)}</td></tr>')
+                emit(f'<tr class="bye"><td colspan="8">'
+                     f'BYE: {", ".join(bye_teams)}</td></tr>')
 
-            parts.append("</table>")
+            emit("</table>")
 
     # --- Unscheduled games ---
     if unscheduled:
-        parts.append(f'<h2 id="unscheduled" style="color:#c00">'
-                     f'Unscheduled Games ({len(unscheduled)})</h2>')
-        parts.append('<p>These games could not be assigned a field/time.</p>')
-        parts.append("<table>")
-        parts.append("<tr><th></th><th>Home</th><th></th>"
-                     "<th>Visitor</th><th>Week</th></tr>")
+        emit(f'<h2 id="unscheduled" style="color:#c00">'
+             f'Unscheduled Games ({len(unscheduled)})</h2>')
+        emit('<p>These games could not be assigned a field/time.</p>')
+        emit("<table>")
+        emit("<tr><th></th><th>Home</th><th></th>"
+             "<th>Visitor</th><th>Week</th></tr>")
         for g in unscheduled:
             gtype_emoji = CROSS_EMOJI if g.game_type == "crossover" else INTRA_EMOJI
-            parts.append(
+            emit(
                 f'<tr style="background:#f8d7da">'
                 f'<td class="game-type">{gtype_emoji}</td>'
-                f'<td class="home">{escape(g.home_team)}</td>'
+                f'<td class="home">{esc_team[g.home_team]}</td>'
                 f"<td>vs</td>"
-                f"<td>{escape(g.away_team)}</td>"
+                f"<td>{esc_team[g.away_team]}</td>"
                 f"<td>W{g.week_number} {'WD' if g.slot_type == 'weekday' else 'WE'}</td>"
                 f"</tr>"
             )
-        parts.append("</table>")
+        emit("</table>")
 
     # --- Per-league schedules ---
-    by_team: dict[str, list[Game]] = defaultdict(list)
-    for g in scheduled:
-        by_team[g.home_team].append(g)
-        by_team[g.away_team].append(g)
-
-    # Track unscheduled per team
-    unsched_by_team: dict[str, list[Game]] = defaultdict(list)
-    for g in unscheduled:
-        unsched_by_team[g.home_team].append(g)
-        unsched_by_team[g.away_team].append(g)
-
-    # Build set of (week_number, slot_type) that exist in the schedule
-    all_slots_set = {(g.week_number,
-                      "weekend" if g.date.weekday() >= 5 else "weekday")
-                     for g in scheduled}
-    # Include slots that only have unscheduled games
-    for g in unscheduled:
-        st = g.slot_type if g.slot_type else "weekend"
-        all_slots_set.add((g.week_number, st))
-    all_slots = sorted(all_slots_set)
-    # Date range per slot for display
-    slot_dates: dict[tuple[int, str], list[date]] = defaultdict(list)
-    for g in scheduled:
-        st = "weekend" if g.date.weekday() >= 5 else "weekday"
-        slot_dates[(g.week_number, st)].append(g.date)
-
     for league_code in sorted(leagues.keys()):
         league = leagues[league_code]
-        parts.append(f'<h2 id="league-{league_code}">'
-                     f'{escape(league.full_name)} ({league_code})</h2>')
+        emit(f'<h2 id="league-{league_code}">'
+             f'{esc_league[league_code]} ({league_code})</h2>')
 
         # Show blackout dates for this league
         if league.blackout_ranges:
@@ -418,28 +488,27 @@ def format_schedule_html(games: list[Game], teams: dict, leagues: dict,
                 else:
                     bo_parts.append(f"{start.strftime('%-m/%-d')}"
                                     f"&ndash;{end.strftime('%-m/%-d')}")
-            parts.append(f'<p class="blackout">Blackout: {", ".join(bo_parts)}</p>')
+            emit(f'<p class="blackout">Blackout: {", ".join(bo_parts)}</p>')
 
         for team_code in sorted(league.teams):
-            team_games = sorted(by_team.get(team_code, []),
-                                key=lambda g: (g.date, g.start_time))
+            team_rows = sorted(by_team.get(team_code, []), key=_KEY_DATE_TIME)
 
-            home_count = sum(1 for g in team_games if g.home_team == team_code)
-            away_count = len(team_games) - home_count
+            home_count = sum(1 for r in team_rows
+                             if r.game.home_team == team_code)
+            away_count = len(team_rows) - home_count
 
-            parts.append(f"<h4>{escape(team_code)} &mdash; "
-                         f"{len(team_games)} games "
-                         f"({home_count}H / {away_count}V)</h4>")
-            parts.append("<table>")
-            parts.append("<tr><th>Game</th><th>#</th><th>Week</th><th>Date</th><th>Time</th>"
-                         "<th>H/V</th><th>Host</th><th>Opponent</th>"
-                         "<th>Field</th><th>R#</th></tr>")
+            emit(f"<h4>{esc_team[team_code]} &mdash; "
+                 f"{len(team_rows)} games "
+                 f"({home_count}H / {away_count}V)</h4>")
+            emit("<table>")
+            emit("<tr><th>Game</th><th>#</th><th>Week</th><th>Date</th><th>Time</th>"
+                 "<th>H/V</th><th>Host</th><th>Opponent</th>"
+                 "<th>Field</th><th>R#</th></tr>")
 
             # Index this team's games by (week, slot_type) for BYE detection
-            team_slot_games: dict[tuple[int, str], Game] = {}
-            for g in team_games:
-                st = "weekend" if g.date.weekday() >= 5 else "weekday"
-                team_slot_games[(g.week_number, st)] = g
+            team_slot_rows: dict[tuple[int, str], _GameRow] = {}
+            for row in team_rows:
+                team_slot_rows[(row.game.week_number, row.slot)] = row
 
             # Index unscheduled games by (week, slot_type) for this team
             team_unsched_slot: dict[tuple[int, str], list[Game]] = defaultdict(list)
@@ -450,9 +519,10 @@ def format_schedule_html(games: list[Game], teams: dict, leagues: dict,
             game_num = 0
             for wk, st in all_slots:
                 slot_label = "WD" if st == "weekday" else "WE"
-                g = team_slot_games.get((wk, st))
+                row = team_slot_rows.get((wk, st))
 
-                if g:
+                if row:
+                    g = row.game
                     game_num += 1
                     is_home = g.home_team == team_code
                     is_host = g.host_team == team_code
@@ -460,26 +530,25 @@ def format_schedule_html(games: list[Game], teams: dict, leagues: dict,
                     ha = "Home" if is_home else "Visitor"
                     ha_cls = "home" if is_home else "away"
                     host_emoji = "\U0001F3E0" if is_host else ""
-                    rnd_label = _round_label(g, pools)
+                    rnd_label = row.round_label
                     rnd_style = ' style="color:#999"' if g.round_number == 0 else ""
-                    field_html = _fmt_field(g.field_name, field_info)
-
-                    gcode = game_codes.get(id(g), "")
-
-                    parts.append(
-                        f"<tr>"
-                        f"<td>{gcode}</td>"
-                        f"<td>{game_num}</td>"
-                        f"<td>W{wk} {slot_label}</td>"
-                        f"<td>{_fmt_date_short(g.date)}</td>"
-                        f"<td>{_fmt_time(g.start_time)}</td>"
-                        f'<td class="{ha_cls}">{ha}</td>'
-                        f"<td>{host_emoji}</td>"
-                        f"<td>{escape(opponent)}</td>"
-                        f"<td>{field_html}</td>"
-                        f"<td{rnd_style}>{rnd_label}</td>"
-                        f"</tr>"
-                    )
+                    field_html = field_html_cache[g.field_name]
+
+                    emit(_TEAM_ROW.format_map({
+                        "gcode": row.code,
+                        "num": game_num,
+                        "wk": wk,
+                        "slot": slot_label,
+                        "date": _fmt_date_short(g.date),
+                        "time": time_html[g.start_time],
+                        "ha_cls": ha_cls,
+                        "ha": ha,
+                        "host": host_emoji,
+                        "opponent": esc_team[opponent],
+                        "field": field_html,
+                        "rnd_style": rnd_style,
+                        "rnd": rnd_label,
+                    }))
                 elif (wk, st) in team_unsched_slot:
                     # Unscheduled game in this slot — show in red
                     for ug in team_unsched_slot[(wk, st)]:
@@ -487,77 +556,89 @@ def format_schedule_html(games: list[Game], teams: dict, leagues: dict,
                                     else ug.home_team)
                         gtype_emoji = (CROSS_EMOJI if ug.game_type == "crossover"
                                        else INTRA_EMOJI)
-                        parts.append(
+                        emit(
                             f'<tr style="background:#f8d7da">'
                             f'<td></td><td></td>'
                             f'<td>W{wk} {slot_label}</td>'
                             f'<td colspan="2">UNSCHED</td>'
                             f'<td></td><td>{gtype_emoji}</td>'
-                            f'<td>{escape(opponent)}</td>'
+                            f'<td>{esc_team[opponent]}</td>'
                             f'<td colspan="2"></td></tr>'
                         )
                 else:
                     # No game — check if blacked out or weekday-only
-                    dates_in_slot = slot_dates.get((wk, st), [])
+                    dates_in_slot = slots[(wk, st)].dates
                     is_blackout = any(league.is_blacked_out(d)
                                       for d in dates_in_slot)
                     if is_blackout:
-                        parts.append(
+                        emit(
                             f'<tr class="blackout">'
                             f'<td></td><td></td><td>W{wk} {slot_label}</td>'
                             f'<td colspan="7">Blackout</td></tr>'
                         )
                     elif st == "weekend" and teams[team_code].weekday_only:
-                        parts.append(
+                        emit(
                             f'<tr class="blackout">'
                             f'<td></td><td></td><td>W{wk} {slot_label}</td>'
                             f'<td colspan="7">Weekdays Only</td></tr>'
                         )
                     else:
-                        parts.append(
+                        emit(
                             f'<tr class="bye">'
                             f'<td></td><td></td><td>W{wk} {slot_label}</td>'
                             f'<td colspan="7">BYE</td></tr>'
                         )
 
-            parts.append("</table>")
+            emit("</table>")
 
     # --- Statistics & Validation ---
     if stats:
         all_teams = stats["all_teams"]
 
-        parts.append('<h2 id="stats">Schedule Statistics</h2>')
+        emit('<h2 id="stats">Schedule Statistics</h2>')
 
         # Home/Away Balance table
         def _hz(v):
             """Format int for HTML, suppressing zeros to empty string."""
             return str(v) if v else ""
 
-        parts.append("<h3>Season Balance</h3>")
-        parts.append('<table class="stat-table">')
-        parts.append("<tr><th>Team</th><th>Home</th><th>Visitor</th>"
-                     "<th>Host</th><th>H-Away</th><th>Total</th><th>Diff</th>"
-                     "<th>WD-H</th><th>WD-V</th>"
-                     "<th>WE-H</th><th>WE-V</th>"
-                     "<th>BO</th><th>BYE</th><th>UNS</th></tr>")
+        emit("<h3>Season Balance</h3>")
+        emit('<table class="stat-table">')
+        emit("<tr><th>Team</th><th>Home</th><th>Visitor</th>"
+             "<th>Host</th><th>H-Away</th><th>Total</th><th>Diff</th>"
+             "<th>WD-H</th><th>WD-V</th>"
+             "<th>WE-H</th><th>WE-V</th>"
+             "<th>BO</th><th>BYE</th><th>UNS</th></tr>")
+        home_counts = stats["home_counts"]
+        away_counts = stats["away_counts"]
+        hosted_counts = stats["hosted_counts"]
+        home_not_hosting = stats.get("home_not_hosting", {})
+        total_games = stats["total_games"]
+        weekday_home = stats["weekday_home"]
+        weekday_away = stats["weekday_away"]
+        weekend_home = stats["weekend_home"]
+        weekend_away = stats["weekend_away"]
+        blackout_counts = stats.get("blackout_counts", {})
+        bye_counts = stats.get("bye_counts", {})
+        unsched_per_team = stats.get("unsched_per_team", {})
         for t in all_teams:
-            h = stats["home_counts"].get(t, 0)
-            a = stats["away_counts"].get(t, 0)
-            hosted = stats["hosted_counts"].get(t, 0)
-            hnh = stats.get("home_not_hosting", {}).get(t, 0)
-            tot = stats["total_games"].get(t, 0)
+            h = home_counts.get(t, 0)
+            a = away_counts.get(t, 0)
+            hosted = hosted_counts.get(t, 0)
+            hnh = home_not_hosting.get(t, 0)
+            tot = total_games.get(t, 0)
             diff = h - a
-            wdh = stats["weekday_home"].get(t, 0)
-            wda = stats["weekday_away"].get(t, 0)
-            weh = stats["weekend_home"].get(t, 0)
-            wea = stats["weekend_away"].get(t, 0)
-            bo = stats.get("blackout_counts", {}).get(t, 0)
-            bye = stats.get("bye_counts", {}).get(t, 0)
-            uns = stats.get("unsched_per_team", {}).get(t, 0)
+            wdh = weekday_home.get(t, 0)
+            wda = weekday_away.get(t, 0)
+            weh = weekend_home.get(t, 0)
+            wea = weekend_away.get(t, 0)
+            bo = blackout_counts.get(t, 0)
+            bye = bye_counts.get(t, 0)
+            uns = unsched_per_team.get(t, 0)
             flag_cls = ' class="flag"' if abs(diff) > 1 else ""
             diff_str = f"+{diff}" if diff > 0 else str(diff) if diff else ""
-            parts.append(
-                f"<tr><td><strong>{escape(t)}</strong></td>"
+            emit(
+                f"<tr><td><strong>{esc_team[t]}</strong></td>"
                 f"<td>{_hz(h)}</td><td>{_hz(a)}</td><td>{_hz(hosted)}</td>"
                 f"<td>{_hz(hnh)}</td><td>{_hz(tot)}</td>"
                 f"<td{flag_cls}>{diff_str}</td>"
@@ -565,81 +646,80 @@ def format_schedule_html(games: list[Game], teams: dict, leagues: dict,
                 f"<td>{_hz(weh)}</td><td>{_hz(wea)}</td>"
                 f"<td>{_hz(bo)}</td><td>{_hz(bye)}</td><td>{_hz(uns)}</td></tr>"
             )
-        parts.append("</table>")
+        emit("</table>")
 
         # Matchup Matrix
-        parts.append("<h3>Matchup Matrix</h3>")
-        parts.append('<table class="stat-table">')
-        parts.append('<tr><th></th>' +
-                     ''.join(f'<th class="matrix-header">{escape(t)}</th>'
-                             for t in all_teams) + '</tr>')
-        for t1 in all_teams:
-            row = f'<tr><td><strong>{escape(t1)}</strong></td>'
-            for t2 in all_teams:
-                if t1 == t2:
-                    row += '<td class="matrix-cell" style="color:#ccc">&ndash;</td>'
-                else:
-                    c = stats["matchup_counts"].get(t1, {}).get(t2, 0)
-                    if c == 1:
-                        style = ' style="background:#d4edda"'
-                    elif c > 1:
-                        style = ' style="background:#f8d7da"'
-                    else:
-                        style = ""
-                    row += f'<td class="matrix-cell"{style}>{c}</td>'
-            parts.append(row + "</tr>")
-        parts.append("</table>")
+        emit("<h3>Matchup Matrix</h3>")
+        emit('<table class="stat-table">')
+        esc_all = [esc_team[t] for t in all_teams]
+        matchup_counts = stats["matchup_counts"]
+        emit('<tr><th></th>' +
+             ''.join(f'<th class="matrix-header">{e}</th>' for e in esc_all) +
+             '</tr>')
+        for i, t1 in enumerate(all_teams):
+            row_counts = matchup_counts.get(t1, {})
+            cells = []
+            for j, t2 in enumerate(all_teams):
+                if i == j:
+                    cells.append(_DIAG_CELL)
+                    continue
+                c = row_counts.get(t2, 0)
+                if not c:
+                    cells.append(_EMPTY_CELL)
+                    continue
+                cells.append(_NONZERO_CELL[min(c, 2)] % c)
+            emit(f'<tr><td><strong>{esc_all[i]}</strong></td>'
+                 f'{"".join(cells)}</tr>')
+        emit("</table>")
 
         # Games per day of week + Games per week — side by side
+        games_per_week = stats["games_per_week"]
         max_week = max(
-            (max(wk.keys()) for wk in stats["games_per_week"].values() if wk),
+            (max(wk.keys()) for wk in games_per_week.values() if wk),
             default=0
         )
 
-        parts.append('<div class="side-by-side">')
+        emit('<div class="side-by-side">')
 
         # Left: Games per day of week
-        parts.append("<div>")
-        parts.append("<h3>Games per Day of Week</h3>")
+        emit("<div>")
+        emit("<h3>Games per Day of Week</h3>")
         days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        parts.append('<table class="stat-table">')
-        parts.append("<tr><th>Team</th>" +
-                     "".join(f"<th>{d}</th>" for d in days) + "</tr>")
+        emit('<table class="stat-table">')
+        emit("<tr><th>Team</th>" +
+             "".join(f"<th>{d}</th>" for d in days) + "</tr>")
+        day_counts = stats["day_counts"]
         for t in all_teams:
-            row = f"<tr><td><strong>{escape(t)}</strong></td>"
-            for d in days:
-                c = stats["day_counts"].get(t, {}).get(d, 0)
-                row += f"<td>{c}</td>"
-            parts.append(row + "</tr>")
-        parts.append("</table>")
-        parts.append("</div>")
+            dc = day_counts.get(t, {})
+            cells = "".join(f"<td>{dc.get(d, 0)}</td>" for d in days)
+            emit(f"<tr><td><strong>{esc_team[t]}</strong></td>{cells}</tr>")
+        emit("</table>")
+        emit("</div>")
 
         # Right: Games per week
         if max_week > 0:
-            parts.append("<div>")
-            parts.append("<h3>Games per Week</h3>")
-            parts.append('<table class="stat-table">')
-            parts.append("<tr><th>Team</th>" +
-                         "".join(f"<th>W{w}</th>" for w in range(1, max_week + 1)) +
-                         "</tr>")
+            emit("<div>")
+            emit("<h3>Games per Week</h3>")
+            emit('<table class="stat-table">')
+            weeks = range(1, max_week + 1)
+            emit("<tr><th>Team</th>" +
+                 "".join(f"<th>W{w}</th>" for w in weeks) + "</tr>")
             for t in all_teams:
-                row = f"<tr><td><strong>{escape(t)}</strong></td>"
-                for w in range(1, max_week + 1):
-                    c = stats["games_per_week"].get(t, {}).get(w, 0)
-                    if c > 3:
-                        row += f'<td style="background:#f8d7da">{c}</td>'
-                    else:
-                        row += f"<td>{c}</td>"
-                parts.append(row + "</tr>")
-            parts.append("</table>")
-            parts.append("</div>")
+                wc = games_per_week.get(t, {})
+                cells = "".join(
+                    f'<td style="background:#f8d7da">{c}</td>' if c > 3
+                    else f"<td>{c}</td>"
+                    for c in (wc.get(w, 0) for w in weeks))
+                emit(f"<tr><td><strong>{esc_team[t]}</strong></td>{cells}</tr>")
+            emit("</table>")
+            emit("</div>")
 
-        parts.append("</div>")
+        emit("</div>")
 
         # Field Slot Utilization grid
         field_slot_usage = stats.get("field_slot_usage", {})
         if field_slot_usage:
-            parts.append("<h3>Field Slot Utilization</h3>")
+            emit("<h3>Field Slot Utilization</h3>")
 
             # Collect all week-slots and sort them
             all_week_slots = set()
@@ -652,58 +732,56 @@ def format_schedule_html(games: list[Game], teams: dict, leagues: dict,
                          "Fri": 4, "Sat": 5, "Sun": 6}
             field_slots = sorted(field_slot_usage.keys(),
                                  key=lambda fs: (fs[0], day_order.get(fs[1], 9), fs[2]))
+            # A field appears once per day/time slot; escape each name once
+            esc_field = {fs[0]: escape(fs[0]) for fs in field_slots}
 
-            parts.append('<table class="stat-table">')
+            emit('<table class="stat-table">')
             # Header row
-            hdr = "<tr><th>Field</th><th>Day</th><th>Time</th>"
-            for wk, st in week_slot_cols:
-                hdr += f'<th class="matrix-header">W{wk}<br>{st}</th>'
-            hdr += "</tr>"
-            parts.append(hdr)
+            emit("<tr><th>Field</th><th>Day</th><th>Time</th>" +
+                 "".join(f'<th class="matrix-header">W{wk}<br>{st}</th>'
+                         for wk, st in week_slot_cols) + "</tr>")
 
             for fs in field_slots:
                 field_name, dow, start_time = fs
-                row = (f"<tr><td>{escape(field_name)}</td>"
-                       f"<td>{dow}</td>"
-                       f"<td>{_fmt_time(start_time)}</td>")
+                usage = field_slot_usage[fs]
+                cells = []
                 for ws in week_slot_cols:
-                    c = field_slot_usage[fs].get(ws, 0)
-                    if c == 0:
-                        row += '<td class="matrix-cell" style="color:#ccc">0</td>'
-                    elif c == 1:
-                        row += f'<td class="matrix-cell" style="background:#d4edda">{c}</td>'
-                    else:
-                        row += f'<td class="matrix-cell" style="background:#f8d7da">{c}</td>'
-                parts.append(row + "</tr>")
-            parts.append("</table>")
+                    c = usage.get(ws, 0)
+                    cells.append(_NONZERO_CELL[min(c, 2)] % c if c
+                                 else _UNUSED_CELL)
+                emit(f"<tr><td>{esc_field[field_name]}</td>"
+                     f"<td>{dow}</td>"
+                     f"<td>{time_html[start_time]}</td>"
+                     f'{"".join(cells)}</tr>')
+            emit("</table>")
 
     # --- Validation errors & warnings ---
     if validation_result:
-        parts.append('<h2 id="report">Validation Report</h2>')
+        emit('<h2 id="report">Validation Report</h2>')
         if validation_result["valid"]:
-            parts.append('<p class="valid">VALID &mdash; '
-                         'no hard constraint violations</p>')
+            emit('<p class="valid">VALID &mdash; '
+                 'no hard constraint violations</p>')
         else:
             n = len(validation_result["errors"])
-            parts.append(f'<p class="invalid">INVALID &mdash; '
-                         f'{n} violation{"s" if n != 1 else ""}</p>')
+            emit(f'<p class="invalid">INVALID &mdash; '
+                 f'{n} violation{"s" if n != 1 else ""}</p>')
 
         if validation_result["errors"]:
-            parts.append(f"<h3>Errors ({len(validation_result['errors'])})</h3>")
-            parts.append("<ul>")
+            emit(f"<h3>Errors ({len(validation_result['errors'])})</h3>")
+            emit("<ul>")
             for e in validation_result["errors"]:
-                parts.append(f'<li class="error-item">{escape(e)}</li>')
-            parts.append("</ul>")
+                emit(f'<li class="error-item">{escape(e)}</li>')
+            emit("</ul>")
 
         if validation_result["warnings"]:
-            parts.append(f"<h3>Warnings ({len(validation_result['warnings'])})</h3>")
-            parts.append("<ul>")
+            emit(f"<h3>Warnings ({len(validation_result['warnings'])})</h3>")
+            emit("<ul>")
             for w in validation_result["warnings"]:
-                parts.append(f'<li class="warn-item">{escape(w)}</li>')
-            parts.append("</ul>")
+                emit(f'<li class="warn-item">{escape(w)}</li>')
+            emit("</ul>")
 
-    parts.append("</body></html>")
-    return "\n".join(parts)
+    buf.write("</body></html>")
+    return buf.getvalue()
 
 
 def write_schedule_html(games: list[Game], teams: dict, leagues: dict,
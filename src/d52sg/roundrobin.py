@@ -1,10 +1,45 @@
 """Round-robin schedule generation with shuffle for D52 scheduling app. """
 
 import random
+from collections import defaultdict
+
 from d52sg.models import Matchup, Round
 
 
-def generate_round_robin(teams: list[str], seed: int | None = None) -> list[Round]:
+# Used when neither a seed nor an rng is given, so unseeded calls share one
+# generator instead of each seeding a new one from OS entropy
+_shared_rng = random.Random()
+
+
+def _get_rng(seed: int | None, rng: random.Random | None) -> random.Random:
+    if rng is not None:
+        return rng
+    if seed is None:
+        return _shared_rng
+    return random.Random(seed)
+
+
+def _random_flip_matchups(rounds: list[Round], rng: random.Random):
+    """Swap team_a/team_b in each matchup with probability 1/2.
+
+    Draws all the randomness in one getrandbits call. Each flip reads the
+    same generator output a per-matchup ``rng.random() < 0.5`` would: that
+    call consumes two 32-bit words and is below 0.5 exactly when the first
+    word's top bit is clear. So seeded schedules are unchanged.
+    """
+    matchups = [m for rnd in rounds for m in rnd.matchups]
+    if not matchups:
+        return
+    n = len(matchups)
+    words = rng.getrandbits(64 * n).to_bytes(8 * n, "little")
+    for k, m in enumerate(matchups):
+        # Byte 3 of each 8-byte group holds the top bits of its first word
+        if words[8 * k + 3] < 0x80:
+            m.team_a, m.team_b = m.team_b, m.team_a
+
+
+def generate_round_robin(teams: list[str], seed: int | None = None,
+                         rng: random.Random | None = None) -> list[Round]:
     """Generate a full round-robin schedule using the circle method.
 
     For N teams: N-1 rounds if even, N-1 rounds with byes if odd.
@@ -12,31 +47,34 @@ def generate_round_robin(teams: list[str], seed: int | None = None) -> list[Roun
     so the schedule looks random while remaining balanced.
 
     Returns list of Rounds, each containing N/2 matchups (and 1 bye if odd).
+    Randomness comes from rng if given, otherwise from seed.
     """
-    rng = random.Random(seed)
+    n = len(teams)
+    if n < 2:
+        return []
+    rng = _get_rng(seed, rng)
 
     # Shuffle team order so the circle method doesn't produce predictable patterns
     shuffled = list(teams)
     rng.shuffle(shuffled)
 
-    n = len(shuffled)
-    if n < 2:
-        return []
-
     # For odd number of teams, add a dummy for byes
     use_dummy = n % 2 == 1
     if use_dummy:
         shuffled.append("__BYE__")
         n += 1
 
-    # Circle method: fix position 0, rotate the rest
+    # Circle method: fix position 0, rotate the rest. Rather than rebuilding
+    # the list each round, position p (1..n-1) in round r holds
+    # shuffled[1 + (p - 1 - r) % (n - 1)].
+    m = n - 1
     rounds = []
     for r in range(n - 1):
         matchups = []
         bye_teams = []
         for i in range(n // 2):
-            t1 = shuffled[i]
-            t2 = shuffled[n - 1 - i]
+            t1 = shuffled[0] if i == 0 else shuffled[1 + (i - 1 - r) % m]
+            t2 = shuffled[1 + (n - 2 - i - r) % m]
             if t1 == "__BYE__":
                 bye_teams.append(t2)
             elif t2 == "__BYE__":
@@ -51,9 +89,6 @@ def generate_round_robin(teams: list[str], seed: int | None = None) -> list[Roun
             bye_teams=bye_teams,
         ))
 
-        # Rotate: keep position 0 fixed, shift others
-        shuffled = [shuffled[0]] + [shuffled[-1]] + shuffled[1:-1]
-
     # Shuffle round order
     rng.shuffle(rounds)
 
@@ -62,16 +97,14 @@ def generate_round_robin(teams: list[str], seed: int | None = None) -> list[Roun
         rnd.number = i + 1
 
     # Randomly flip home/away within each matchup for additional randomness
-    for rnd in rounds:
-        for m in rnd.matchups:
-            if rng.random() < 0.5:
-                m.team_a, m.team_b = m.team_b, m.team_a
+    _random_flip_matchups(rounds, rng)
 
     return rounds
 
 
 def generate_crossover(north: list[str], south: list[str],
-                       seed: int | None = None) -> list[Round]:
+                       seed: int | None = None,
+                       rng: random.Random | None = None) -> list[Round]:
     """Generate crossover rounds pairing North vs South teams.
 
     Every North team must play every South team exactly once.
@@ -81,14 +114,14 @@ def generate_crossover(north: list[str], south: list[str],
 
     Uses a Latin square approach: create an N×M assignment matrix where
     entry (i,j) = round in which north[i] plays south[j].
+    Randomness comes from rng if given, otherwise from seed.
     """
-    rng = random.Random(seed)
-
     n_north = len(north)
     n_south = len(south)
 
     if n_north == 0 or n_south == 0:
         return []
+    rng = _get_rng(seed, rng)
 
     # Shuffle both pools
     north_shuffled = list(north)
@@ -100,23 +133,23 @@ def generate_crossover(north: list[str], south: list[str],
     # This guarantees no conflicts (no two matchups in the same round share a team)
     num_rounds = max(n_north, n_south)
 
-    round_matchups: dict[int, list[Matchup]] = {r: [] for r in range(num_rounds)}
-    round_byes: dict[int, list[str]] = {r: [] for r in range(num_rounds)}
-
-    for i in range(n_north):
-        for j in range(n_south):
-            r = (i + j) % num_rounds
-            round_matchups[r].append(Matchup(north_shuffled[i], south_shuffled[j]))
+    # Since num_rounds >= n_south, north[i] has at most one opponent in
+    # round r: south[(r - i) % num_rounds], when that index is in range.
+    # Solving for j directly builds each round in one pass over north.
+    round_matchups: dict[int, list[Matchup]] = {
+        r: [Matchup(north_shuffled[i], south_shuffled[j])
+            for i in range(n_north)
+            if (j := (r - i) % num_rounds) < n_south]
+        for r in range(num_rounds)
+    }
 
-    # Figure out byes: teams not playing in each round
-    for r in range(num_rounds):
-        playing = set()
-        for m in round_matchups[r]:
-            playing.add(m.team_a)
-            playing.add(m.team_b)
-        for t in north_shuffled + south_shuffled:
-            if t not in playing:
-                round_byes[r].append(t)
+    # Figure out byes: teams not playing in each round (north then south,
+    # in shuffled order)
+    all_teams = north_shuffled + south_shuffled
+    round_byes: dict[int, list[str]] = {}
+    for r, matchups in round_matchups.items():
+        playing = set().union(*((m.team_a, m.team_b) for m in matchups))
+        round_byes[r] = [t for t in all_teams if t not in playing]
 
     rounds = []
     for r in range(num_rounds):
@@ -133,51 +166,74 @@ def generate_crossover(north: list[str], south: list[str],
         rnd.number = i + 1
 
     # Randomly flip home/away within each matchup
-    for rnd in rounds:
-        for m in rnd.matchups:
-            if rng.random() < 0.5:
-                m.team_a, m.team_b = m.team_b, m.team_a
+    _random_flip_matchups(rounds, rng)
 
     return rounds
 
 
-def verify_round_robin(rounds: list[Round], teams: list[str]) -> dict:
-    """Verify a round-robin schedule is valid and complete.
+def _pair(a: str, b: str) -> tuple[str, str]:
+    """Order-normalized matchup key."""
+    return (a, b) if a < b else (b, a)
 
-    Returns dict with:
-    - valid: bool
-    - errors: list of error strings
-    - matchup_counts: dict of (team_a, team_b) -> count
-    - games_per_team: dict of team -> game count
+
+def _tally(rounds: list[Round], teams: list[str]
+           ) -> tuple[list[str], dict[tuple[str, str], int], dict[str, int]]:
+    """Counting pass shared by the verifiers.
+
+    Returns (errors, matchup_counts, games_per_team): errors holds any team
+    appearing twice in one round, matchup_counts is keyed by _pair, and
+    games_per_team starts every listed team at 0.
     """
     errors = []
-    matchup_counts: dict[tuple[str, str], int] = {}
-    games_per_team: dict[str, int] = {t: 0 for t in teams}
+    matchup_counts: dict[tuple[str, str], int] = defaultdict(int)
+    games_per_team: dict[str, int] = defaultdict(int, dict.fromkeys(teams, 0))
 
     for rnd in rounds:
         teams_in_round = set()
         for m in rnd.matchups:
+            a, b = m.team_a, m.team_b
             # Check for duplicate teams in a round
-            if m.team_a in teams_in_round:
-                errors.append(f"Round {rnd.number}: {m.team_a} appears twice")
-            if m.team_b in teams_in_round:
-                errors.append(f"Round {rnd.number}: {m.team_b} appears twice")
-            teams_in_round.add(m.team_a)
-            teams_in_round.add(m.team_b)
+            if a in teams_in_round:
+                errors.append(f"Round {rnd.number}: {a} appears twice")
+            if b in teams_in_round:
+                errors.append(f"Round {rnd.number}: {b} appears twice")
+            teams_in_round.add(a)
+            teams_in_round.add(b)
 
             # Track matchups (normalize order)
-            key = tuple(sorted([m.team_a, m.team_b]))
-            matchup_counts[key] = matchup_counts.get(key, 0) + 1
-            games_per_team[m.team_a] = games_per_team.get(m.team_a, 0) + 1
-            games_per_team[m.team_b] = games_per_team.get(m.team_b, 0) + 1
-
-    # Check every pair plays exactly once
-    for i, t1 in enumerate(teams):
-        for t2 in teams[i + 1:]:
-            key = tuple(sorted([t1, t2]))
-            count = matchup_counts.get(key, 0)
-            if count != 1:
-                errors.append(f"{t1} vs {t2}: played {count} times (expected 1)")
+            matchup_counts[(a, b) if a < b else (b, a)] += 1
+            games_per_team[a] += 1
+            games_per_team[b] += 1
+
+    return errors, dict(matchup_counts), dict(games_per_team)
+
+
+def verify_round_robin(rounds: list[Round], teams: list[str]) -> dict:
+    """Verify a round-robin schedule is valid and complete.
+
+    Returns dict with:
+    - valid: bool
+    - errors: list of error strings
+    - matchup_counts: dict of (team_a, team_b) -> count
+    - games_per_team: dict of team -> game count
+    """
+    errors, matchup_counts, games_per_team = _tally(rounds, teams)
+
+    # Check every pair plays exactly once. That holds iff the counts cover
+    # exactly n*(n-1)/2 distinct pairs of listed teams, each seen once, so
+    # only walk every pair when something is off and needs naming.
+    n = len(teams)
+    team_set = set(teams)
+    if (len(matchup_counts) != n * (n - 1) // 2
+            or any(c != 1 for c in matchup_counts.values())
+            or any(a == b or a not in team_set or b not in team_set
+                   for a, b in matchup_counts)):
+        for i, t1 in enumerate(teams):
+            for t2 in teams[i + 1:]:
+                key = _pair(t1, t2)
+                count = matchup_counts.get(key, 0)
+                if count != 1:
+                    errors.append(f"{t1} vs {t2}: played {count} times (expected 1)")
 
     return {
         "valid": len(errors) == 0,
@@ -190,32 +246,23 @@ def verify_round_robin(rounds: list[Round], teams: list[str]) -> dict:
 def verify_crossover(rounds: list[Round], north: list[str],
                      south: list[str]) -> dict:
     """Verify crossover rounds: every north team plays every south team exactly once."""
-    errors = []
-    matchup_counts: dict[tuple[str, str], int] = {}
-    games_per_team: dict[str, int] = {t: 0 for t in north + south}
-
-    for rnd in rounds:
-        teams_in_round = set()
-        for m in rnd.matchups:
-            if m.team_a in teams_in_round:
-                errors.append(f"Round {rnd.number}: {m.team_a} appears twice")
-            if m.team_b in teams_in_round:
-                errors.append(f"Round {rnd.number}: {m.team_b} appears twice")
-            teams_in_round.add(m.team_a)
-            teams_in_round.add(m.team_b)
-
-            key = tuple(sorted([m.team_a, m.team_b]))
-            matchup_counts[key] = matchup_counts.get(key, 0) + 1
-            games_per_team[m.team_a] = games_per_team.get(m.team_a, 0) + 1
-            games_per_team[m.team_b] = games_per_team.get(m.team_b, 0) + 1
-
-    # Every north-south pair should play exactly once
-    for n_team in north:
-        for s_team in south:
-            key = tuple(sorted([n_team, s_team]))
-            count = matchup_counts.get(key, 0)
-            if count != 1:
-                errors.append(f"{n_team} vs {s_team}: played {count} times (expected 1)")
+    errors, matchup_counts, games_per_team = _tally(rounds, north + south)
+
+    # Every north-south pair should play exactly once; as above, only walk
+    # all pairs when the counts show something to report
+    north_set = set(north)
+    south_set = set(south)
+    if (len(matchup_counts) != len(north) * len(south)
+            or any(c != 1 for c in matchup_counts.values())
+            or not all((a in north_set and b in south_set)
+                       or (a in south_set and b in north_set)
+                       for a, b in matchup_counts)):
+        for n_team in north:
+            for s_team in south:
+                key = _pair(n_team, s_team)
+                count = matchup_counts.get(key, 0)
+                if count != 1:
+                    errors.append(f"{n_team} vs {s_team}: played {count} times (expected 1)")
 
     return {
         "valid": len(errors) == 0,
@@ -1,54 +1,175 @@
 #!/usr/bin/env python3
 """Scan seeds to find schedules with no duplicate matchups and no unscheduled games.
 
-Usage: d52sg-scan [config.yaml] [-n MAX_SEED]
+Usage: d52sg-scan [config.yaml] [-n MAX_SEED] [-j JOBS] [-d] [--cache]
+                  [--format {table,csv}]
 """
 
 import argparse
+import contextlib
 import csv
-import io
+import hashlib
+import json
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from d52sg import __version__
 from d52sg.config import load_config
 from d52sg.scheduler import schedule
 from d52sg.constraints import validate_schedule
 
 
-def scan_seed(config: dict, seed: int) -> dict:
-    """Run a single seed and return summary info."""
-    # Suppress scheduler's verbose output
-    old_stdout = sys.stdout
-    sys.stdout = io.StringIO()
-    try:
+class _NullWriter:
+    """Text sink that discards everything written to it."""
+
+    def write(self, s: str) -> int:
+        return len(s)
+
+    def flush(self):
+        pass
+
+
+_NULL = _NullWriter()
+
+
+def scan_seed(config: dict, seed: int, detailed: bool = False) -> dict:
+    """Run a single seed and return summary info.
+
+    "duplicates" is the number of distinct pairings scheduled more than
+    once. Pass detailed=True to also get "duplicate_pairs", mapping each of
+    those pairings to its game count.
+    """
+    # Suppress scheduler's verbose output; nothing reads it, so discard it
+    # rather than buffering it
+    with contextlib.redirect_stdout(_NULL):
         games = schedule(config, seed=seed)
-    finally:
-        sys.stdout = old_stdout
 
     if not games:
         return {"seed": seed, "ok": False, "error": "no games"}
 
-    scheduled = [g for g in games if not g.unscheduled]
-    unscheduled = [g for g in games if g.unscheduled]
+    if not detailed:
+        # Only the number of repeated pairings is needed, so track them in
+        # sets rather than keeping a count per pairing
+        n_unsched = 0
+        seen = set()
+        repeated = set()
+        for g in games:
+            if g.unscheduled:
+                n_unsched += 1
+                continue
+            a, b = g.home_team, g.away_team
+            key = (a, b) if a < b else (b, a)
+            if key in seen:
+                repeated.add(key)
+            else:
+                seen.add(key)
+        return {
+            "seed": seed,
+            "ok": not repeated and n_unsched == 0,
+            "games": len(games) - n_unsched,
+            "unscheduled": n_unsched,
+            "duplicates": len(repeated),
+        }
 
-    # Check for duplicate matchups
-    from collections import defaultdict
-    matchup_counts = defaultdict(int)
-    for g in scheduled:
-        key = (min(g.home_team, g.away_team), max(g.home_team, g.away_team))
-        matchup_counts[key] += 1
+    # Count unscheduled games and scheduled matchups in one pass
+    n_unsched = 0
+    matchup_counts = Counter()
+    for g in games:
+        if g.unscheduled:
+            n_unsched += 1
+            continue
+        a, b = g.home_team, g.away_team
+        matchup_counts[(a, b) if a < b else (b, a)] += 1
     duplicates = {k: v for k, v in matchup_counts.items() if v > 1}
 
     return {
         "seed": seed,
-        "ok": len(duplicates) == 0 and len(unscheduled) == 0,
-        "games": len(scheduled),
-        "unscheduled": len(unscheduled),
+        "ok": len(duplicates) == 0 and n_unsched == 0,
+        "games": len(games) - n_unsched,
+        "unscheduled": n_unsched,
         "duplicates": len(duplicates),
         "duplicate_pairs": duplicates,
     }
 
 
+# On-disk results from earlier --cache runs, one directory per config
+SCAN_CACHE_ROOT = Path(".d52sg_scan_cache")
+
+# Modules whose code decides a seed's scan result. Their sources are part
+# of the cache key, since __version__ isn't bumped for every code change
+# (e.g. in an editable install).
+_CACHE_KEY_SOURCES = ("config.py", "models.py", "roundrobin.py",
+                      "scheduler.py", "constraints.py", "scan.py")
+
+
+def _cache_dir(config_path: str | Path) -> Path:
+    """Cache directory for a config file, keyed by its bytes, the package
+    version and the scheduling sources. Delete the directory to invalidate
+    it."""
+    h = hashlib.blake2b(Path(config_path).read_bytes(), digest_size=8)
+    h.update(__version__.encode())
+    pkg_dir = Path(__file__).parent
+    for name in _CACHE_KEY_SOURCES:
+        h.update((pkg_dir / name).read_bytes())
+    return SCAN_CACHE_ROOT / h.hexdigest()
+
+
+def _cached_scan_seed(config: dict, seed: int, cache_dir: Path,
+                      detailed: bool = False) -> dict:
+    """scan_seed, reusing a result stored in cache_dir by an earlier run.
+
+    Results are stored as JSON, with duplicate_pairs written as
+    [team_a, team_b, count] entries since JSON keys can't be tuples.
+    """
+    path = cache_dir / f"{seed}{'-detailed' if detailed else ''}.json"
+    try:
+        result = json.loads(path.read_text())
+    except (FileNotFoundError, ValueError):
+        pass
+    else:
+        if "duplicate_pairs" in result:
+            result["duplicate_pairs"] = {
+                (a, b): count for a, b, count in result["duplicate_pairs"]}
+        return result
+
+    result = scan_seed(config, seed, detailed=detailed)
+    stored = dict(result)
+    if "duplicate_pairs" in stored:
+        stored["duplicate_pairs"] = [
+            [a, b, count] for (a, b), count in stored["duplicate_pairs"].items()]
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Write then rename so a concurrent reader never sees a partial file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(stored))
+    os.replace(tmp, path)
+    return result
+
+
+# Config for pool workers, installed once per process by _init_worker so
+# each task only ships a seed instead of re-pickling the whole config
+_worker_config: dict | None = None
+_worker_detailed = False
+_worker_cache_dir: Path | None = None
+
+
+def _init_worker(config: dict, detailed: bool = False,
+                 cache_dir: Path | None = None):
+    global _worker_config, _worker_detailed, _worker_cache_dir
+    _worker_config = config
+    _worker_detailed = detailed
+    _worker_cache_dir = cache_dir
+
+
+def _scan_worker(seed: int) -> dict:
+    if _worker_cache_dir is not None:
+        return _cached_scan_seed(_worker_config, seed, _worker_cache_dir,
+                                 detailed=_worker_detailed)
+    return scan_seed(_worker_config, seed, detailed=_worker_detailed)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Scan seeds to find schedules with no duplicates "
@@ -62,6 +183,25 @@ def main():
         "-n", "--max-seed", type=int, default=100,
         help="Maximum seed to try (default: 100, scans 0..N-1)"
     )
+    parser.add_argument(
+        "-d", "--detailed", action="store_true",
+        help="Also collect each seed's duplicate_pairs (which matchups repeat, "
+             "and how often) and list them under its row"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="Worker processes for scanning seeds (default: CPU count)"
+    )
+    parser.add_argument(
+        "--cache", action="store_true",
+        help=f"Reuse per-seed results from earlier runs with the same config "
+             f"(stored under {SCAN_CACHE_ROOT}/)"
+    )
+    parser.add_argument(
+        "--format", choices=("table", "csv"), default="table",
+        help="Output format: aligned table with summary (default), or one "
+             "CSV row per seed for other tools"
+    )
     args = parser.parse_args()
 
     config_path = args.config
@@ -71,21 +211,50 @@ def main():
 
     config = load_config(config_path)
     max_seed = args.max_seed
+    cache_dir = _cache_dir(config_path) if args.cache else None
 
-    print(f"Scanning seeds 0..{max_seed - 1} using {config_path}...")
-    print(f"{'Seed':>6}  {'Games':>5}  {'Unsched':>7}  {'Dupes':>5}  Result")
-    print("-" * 50)
+    as_csv = args.format == "csv"
+    if as_csv:
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(["seed", "games", "unsched", "dupes", "result"])
+    else:
+        print(f"Scanning seeds 0..{max_seed - 1} using {config_path}...")
+        print(f"{'Seed':>6}  {'Games':>5}  {'Unsched':>7}  {'Dupes':>5}  Result")
+        print("-" * 50)
 
+    # Seeds are independent, so fan them out across worker processes.
+    # Executor.map yields in submission order, so rows still print in seed
+    # order (and live) while later seeds run ahead. Seeds go out in small
+    # batches to cut round trips, while still leaving several batches per
+    # worker so rows keep streaming and the load stays balanced.
     good_seeds = []
-    for seed in range(max_seed):
-        result = scan_seed(config, seed)
-        status = "OK" if result["ok"] else "FAIL"
-        unsched = result.get("unscheduled", "?")
-        dupes = result.get("duplicates", "?")
-        games = result.get("games", "?")
-        print(f"{seed:>6}  {games:>5}  {unsched:>7}  {dupes:>5}  {status}", flush=True)
-        if result["ok"]:
-            good_seeds.append(seed)
+    jobs = max(1, args.jobs)
+    chunksize = max(1, max_seed // (jobs * 8))
+    with ProcessPoolExecutor(max_workers=jobs,
+                             initializer=_init_worker,
+                             initargs=(config, args.detailed,
+                                       cache_dir)) as ex:
+        results = ex.map(_scan_worker, range(max_seed), chunksize=chunksize)
+        for seed, result in zip(range(max_seed), results):
+            status = "OK" if result["ok"] else "FAIL"
+            unsched = result.get("unscheduled", "?")
+            dupes = result.get("duplicates", "?")
+            games = result.get("games", "?")
+            if as_csv:
+                writer.writerow([seed, games, unsched, dupes, status])
+                sys.stdout.flush()
+            else:
+                print(f"{seed:>6}  {games:>5}  {unsched:>7}  {dupes:>5}  {status}")
+                for (a, b), count in sorted(
+                        result.get("duplicate_pairs", {}).items()):
+                    print(f"{'':>6}  {a} vs {b}: {count} games")
+                sys.stdout.flush()
+            if result["ok"]:
+                good_seeds.append(seed)
+
+    # The exit status still reports whether any seed passed
+    if as_csv:
+        sys.exit(0 if good_seeds else 1)
 
     print("-" * 50)
     if good_seeds:
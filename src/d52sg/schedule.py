@@ -70,6 +70,18 @@ Exit codes:
         "--verify", metavar="CSV",
         help="Verify an existing GameChanger CSV instead of generating"
     )
+    parser.add_argument(
+        "--no-html", action="store_true",
+        help="Skip writing schedule.html"
+    )
+    parser.add_argument(
+        "--no-output", "--dry-run", action="store_true",
+        help="Generate and validate only; write no output files"
+    )
+    parser.add_argument(
+        "--quiet", "-q", action="store_true",
+        help="Don't print the statistics report"
+    )
     args = parser.parse_args()
 
     config_path = args.config
@@ -118,38 +130,43 @@ Exit codes:
     report = format_validation_report(result)
     print(report)
 
-    # Stats
-    stats = compute_stats(
-        games, config["teams"], config["leagues"], config["pools"]
-    )
-    stats_text = format_stats_report(
-        stats, config["teams"], config["leagues"], config["pools"]
-    )
-    print("\n" + stats_text)
+    # Stats (only needed if printed or written somewhere)
+    write_output = not args.no_output
+    if write_output or not args.quiet:
+        stats = compute_stats(
+            games, config["teams"], config["leagues"], config["pools"]
+        )
+        stats_text = format_stats_report(
+            stats, config["teams"], config["leagues"], config["pools"]
+        )
+        if not args.quiet:
+            print("\n" + stats_text)
 
     # Write outputs
-    print("\nWriting output files...")
-    write_schedule(
-        games, config["teams"],
-        config["season"]["game_length_minutes"],
-        output_prefix=args.output_prefix,
-        game_code_prefix=config["season"].get("game_code_prefix", "G"),
-    )
-    write_schedule_html(
-        games, config["teams"], config["leagues"],
-        output_prefix=args.output_prefix,
-        field_info=config.get("field_info"),
-        pools=config["pools"],
-        validation_result=result,
-        stats=stats,
-        season_name=config["season"].get("name", ""),
-        game_code_prefix=config["season"].get("game_code_prefix", "G"),
-    )
-
-    # Write stats
-    stats_path = Path(args.output_prefix) / "stats.txt"
-    stats_path.write_text(report + "\n\n" + stats_text)
-    print(f"Written: {stats_path}")
+    if write_output:
+        print("\nWriting output files...")
+        write_schedule(
+            games, config["teams"],
+            config["season"]["game_length_minutes"],
+            output_prefix=args.output_prefix,
+            game_code_prefix=config["season"].get("game_code_prefix", "G"),
+        )
+        if not args.no_html:
+            write_schedule_html(
+                games, config["teams"], config["leagues"],
+                output_prefix=args.output_prefix,
+                field_info=config.get("field_info"),
+                pools=config["pools"],
+                validation_result=result,
+                stats=stats,
+                season_name=config["season"].get("name", ""),
+                game_code_prefix=config["season"].get("game_code_prefix", "G"),
+            )
+
+        # Write stats
+        stats_path = Path(args.output_prefix) / "stats.txt"
+        stats_path.write_text(report + "\n\n" + stats_text)
+        print(f"Written: {stats_path}")
 
     if result["valid"]:
         print("\nSchedule generated successfully!")
@@ -22,6 +22,11 @@ from d52sg.models import (
 )
 
 
+def _pair_key(a: str, b: str) -> tuple[str, str]:
+    """Order-normalized matchup key, as used by global_matchup_counts."""
+    return (a, b) if a < b else (b, a)
+
+
 def build_calendar(start_date: date, end_date: date,
                    teams: dict[str, Team],
                    leagues: dict[str, League]) -> list[CalendarSlot]:
@@ -33,6 +38,16 @@ def build_calendar(start_date: date, end_date: date,
     slots = []
     week_num = 1
 
+    # Each league's blackout days within the season, computed once so each
+    # slot only needs one subset test per league rather than a blackout
+    # lookup per team per day
+    season_dates = [start_date + timedelta(days=i)
+                    for i in range((end_date - start_date).days + 1)]
+    league_blackouts = {
+        code: frozenset(d for d in season_dates if league.is_blacked_out(d))
+        for code, league in leagues.items()
+    }
+
     # Find the Monday of or before start_date
     current = start_date
     if current.weekday() != 0:
@@ -47,14 +62,12 @@ def build_calendar(start_date: date, end_date: date,
                 weekday_dates.append(d)
 
         if weekday_dates:
-            available = set()
-            for code, team in teams.items():
-                league = leagues[team.league_code]
-                has_available_day = any(
-                    not league.is_blacked_out(d) for d in weekday_dates
-                )
-                if has_available_day:
-                    available.add(code)
+            # League code -> has at least one non-blacked-out day this slot
+            wk = frozenset(weekday_dates)
+            league_open = {code: not wk <= bo
+                           for code, bo in league_blackouts.items()}
+            available = {code for code, team in teams.items()
+                         if league_open[team.league_code]}
 
             slots.append(CalendarSlot(
                 week_number=week_num,
@@ -71,16 +84,16 @@ def build_calendar(start_date: date, end_date: date,
                 weekend_dates.append(d)
 
         if weekend_dates:
+            we = frozenset(weekend_dates)
+            league_open = {code: not we <= bo
+                           for code, bo in league_blackouts.items()}
             available = set()
             for code, team in teams.items():
                 if team.weekday_only:
                     if not any(d in team.available_weekends for d in weekend_dates):
                         continue
-                league = leagues[team.league_code]
                 # Check: at least one non-blacked-out day exists
-                non_bo_days = [d for d in weekend_dates
-                               if not league.is_blacked_out(d)]
-                if not non_bo_days:
+                if not league_open[team.league_code]:
                     continue
                 # Check: at least one non-blacked-out day has a matching
                 # field slot (either from this team's league or any opponent's).
@@ -181,13 +194,17 @@ def assign_rounds_to_slots(
         """True if this slot has any blacked-out teams."""
         return len(slot.available_teams) < len(all_team_codes)
 
-    def _score_round(rnd, slot):
+    def _round_pairs(rounds):
+        """Each round's (team_a, team_b) pairs, extracted once for scoring."""
+        return [[(m.team_a, m.team_b) for m in rnd.matchups] for rnd in rounds]
+
+    def _score_round(pairs, slot):
         """Count how many matchups from this round have both teams available."""
-        count = 0
-        for m in rnd.matchups:
-            if m.team_a in slot.available_teams and m.team_b in slot.available_teams:
-                count += 1
-        return count
+        # Every team is available in a non-blackout slot
+        if not _has_blackouts(slot):
+            return len(pairs)
+        avail = slot.available_teams
+        return sum(1 for ta, tb in pairs if ta in avail and tb in avail)
 
     def _place_round(rnd, slot, slot_idx, teams_in_slot_map, slot_matchups,
                      deferred_list):
@@ -216,6 +233,8 @@ def assign_rounds_to_slots(
     # Blackout slots first (fewest available teams), then non-blackout.
     unassigned_north = list(range(len(intra_north_rounds)))
     unassigned_south = list(range(len(intra_south_rounds)))
+    north_pairs = _round_pairs(intra_north_rounds)
+    south_pairs = _round_pairs(intra_south_rounds)
 
     weekday_order = sorted(range(len(weekday_slots)),
                            key=lambda si: len(weekday_slots[si].available_teams))
@@ -226,8 +245,7 @@ def assign_rounds_to_slots(
 
         if unassigned_north:
             best_ni = max(unassigned_north,
-                          key=lambda ni: _score_round(
-                              intra_north_rounds[ni], slot))
+                          key=lambda ni: _score_round(north_pairs[ni], slot))
             rnd = intra_north_rounds[best_ni]
             unassigned_north.remove(best_ni)
             _place_round(rnd, slot, si, weekday_teams_in_slot,
@@ -235,8 +253,7 @@ def assign_rounds_to_slots(
 
         if unassigned_south:
             best_si_ = max(unassigned_south,
-                           key=lambda si_: _score_round(
-                               intra_south_rounds[si_], slot))
+                           key=lambda si_: _score_round(south_pairs[si_], slot))
             rnd = intra_south_rounds[best_si_]
             unassigned_south.remove(best_si_)
             _place_round(rnd, slot, si, weekday_teams_in_slot,
@@ -261,6 +278,7 @@ def assign_rounds_to_slots(
 
     # ---- Step 1b: Assign weekend (crossover) rounds to slots ----
     unassigned_cross = list(range(len(crossover_rounds)))
+    cross_pairs = _round_pairs(crossover_rounds)
 
     weekend_order = sorted(range(len(weekend_slots)),
                            key=lambda si: len(weekend_slots[si].available_teams))
@@ -270,10 +288,8 @@ def assign_rounds_to_slots(
         slot_matchups: list[tuple[Matchup, int]] = []
 
         if unassigned_cross:
-            scored = [(
-                _score_round(crossover_rounds[xi], slot),
-                xi
-            ) for xi in unassigned_cross]
+            scored = [(_score_round(cross_pairs[xi], slot), xi)
+                      for xi in unassigned_cross]
             best_score, best_xi = max(scored)
 
             if best_score >= 1:
@@ -298,7 +314,14 @@ def assign_rounds_to_slots(
     # 2a. Pull from deferred list — find deferred matchups involving idle teams
     # Prioritize by targeting idle teams specifically, not just iterating deferred.
     def _fill_from_deferred(deferred, slots, teams_in_slot_map):
-        still_deferred = list(deferred)
+        # Deferred entries keyed by their original position (dict order is
+        # that order), plus an index of which entries each team appears in
+        still_deferred = dict(enumerate(deferred))
+        team_to_deferred: dict[str, set[int]] = defaultdict(set)
+        for di, (matchup, _rnum) in still_deferred.items():
+            team_to_deferred[matchup.team_a].add(di)
+            team_to_deferred[matchup.team_b].add(di)
+
         any_placed = True
         while any_placed:
             any_placed = False
@@ -306,12 +329,12 @@ def assign_rounds_to_slots(
                 idle = (slot.available_teams - teams_in_slot_map[si])
                 if not idle:
                     continue
-                # Find a deferred matchup involving an idle team
-                for di in range(len(still_deferred)):
+                # Find the earliest deferred matchup involving an idle team
+                candidates = set().union(
+                    *(team_to_deferred[t] for t in idle if t in team_to_deferred))
+                for di in sorted(candidates):
                     matchup, rnum = still_deferred[di]
                     ta, tb = matchup.team_a, matchup.team_b
-                    if ta not in idle and tb not in idle:
-                        continue
                     if ta in teams_in_slot_map[si] or tb in teams_in_slot_map[si]:
                         continue
                     if ta not in slot.available_teams or tb not in slot.available_teams:
@@ -319,10 +342,12 @@ def assign_rounds_to_slots(
                     slot._pending_matchups.append((matchup, rnum, "deferred"))
                     teams_in_slot_map[si].add(ta)
                     teams_in_slot_map[si].add(tb)
-                    still_deferred.pop(di)
+                    del still_deferred[di]
+                    team_to_deferred[ta].discard(di)
+                    team_to_deferred[tb].discard(di)
                     any_placed = True
                     break
-        return still_deferred
+        return list(still_deferred.values())
 
     # Remaining deferred matchups available as "safe ad-hoc" source
     remaining_deferred_weekday: list[tuple[Matchup, int]] = []
@@ -355,20 +380,17 @@ def assign_rounds_to_slots(
     for slot in weekday_slots + weekend_slots:
         if hasattr(slot, '_pending_matchups'):
             for m, _, _src in slot._pending_matchups:
-                key = (min(m.team_a, m.team_b), max(m.team_a, m.team_b))
+                key = _pair_key(m.team_a, m.team_b)
                 global_matchup_counts[key] += 1
 
     def _lookup_safe_pool(team_a, team_b):
         """Check if a pairing exists in the safe pool. If found, remove it
         and return (round_number, "safe_adhoc"). Otherwise return None."""
-        key = (min(team_a, team_b), max(team_a, team_b))
-        for pool in (safe_pool_weekday, safe_pool_weekend):
-            for pi, (pm, prnum) in enumerate(pool):
-                pk = (min(pm.team_a, pm.team_b), max(pm.team_a, pm.team_b))
-                if pk == key:
-                    pool.pop(pi)
-                    return (prnum, "safe_adhoc")
-        return None
+        key = _pair_key(team_a, team_b)
+        rnums = safe_index.get(key)
+        if not rnums:
+            return None
+        return (rnums.pop(0), "safe_adhoc")
 
     def _fill_idle_from_pool(slots_list, teams_in_slot_map, deferred_pool):
         """Fill idle teams using remaining deferred matchups (safe ad-hoc).
@@ -410,7 +432,7 @@ def assign_rounds_to_slots(
                     teams_in_slot_map[si].add(tb)
                     idle.discard(ta)
                     idle.discard(tb)
-                    key = (min(ta, tb), max(ta, tb))
+                    key = _pair_key(ta, tb)
                     global_matchup_counts[key] += 1
                     still_available.pop(i)
                     filled += 1
@@ -436,7 +458,7 @@ def assign_rounds_to_slots(
                 cross_candidates = []
                 for tn in idle_north:
                     for ts in idle_south:
-                        key = (min(tn, ts), max(tn, ts))
+                        key = _pair_key(tn, ts)
                         cross_candidates.append((global_matchup_counts[key], tn, ts))
                 cross_candidates.sort()
                 used = set()
@@ -450,7 +472,7 @@ def assign_rounds_to_slots(
                 same_candidates = []
                 for i, t1 in enumerate(remaining):
                     for t2 in remaining[i + 1:]:
-                        key = (min(t1, t2), max(t1, t2))
+                        key = (t1, t2)  # remaining is sorted
                         same_candidates.append((global_matchup_counts[key], t1, t2))
                 same_candidates.sort()
                 for _, t1, t2 in same_candidates:
@@ -466,7 +488,7 @@ def assign_rounds_to_slots(
                     candidates = []
                     for i, t1 in enumerate(pool_idle):
                         for t2 in pool_idle[i + 1:]:
-                            key = (min(t1, t2), max(t1, t2))
+                            key = (t1, t2)  # pool_idle is sorted
                             candidates.append((global_matchup_counts[key], t1, t2))
                     candidates.sort()
                     for _, t1, t2 in candidates:
@@ -484,7 +506,7 @@ def assign_rounds_to_slots(
                     slot._pending_matchups.append((m, 0, "adhoc"))
                 teams_in_slot_map[si].add(ta)
                 teams_in_slot_map[si].add(tb)
-                key = (min(ta, tb), max(ta, tb))
+                key = _pair_key(ta, tb)
                 global_matchup_counts[key] += 1
                 invented += 1
         return invented
@@ -499,6 +521,12 @@ def assign_rounds_to_slots(
     we_safe, safe_pool_weekend = _fill_idle_from_pool(
         weekend_slots, weekend_teams_in_slot, safe_pool_weekend)
 
+    # What's left of the safe pool, indexed by normalized pairing for
+    # _lookup_safe_pool: round numbers in pool order, weekday pool first
+    safe_index: dict[tuple[str, str], list[int]] = defaultdict(list)
+    for pm, prnum in safe_pool_weekday + safe_pool_weekend:
+        safe_index[_pair_key(pm.team_a, pm.team_b)].append(prnum)
+
     # Then: truly invent pairings only for still-idle teams
     wd_invented = _invent_games(weekday_slots, weekday_teams_in_slot, "weekday")
     we_invented = _invent_games(weekend_slots, weekend_teams_in_slot, "weekend")
@@ -572,7 +600,7 @@ def assign_rounds_to_slots(
                             if swap_out in high_bye:
                                 continue
                             # bye_team plays against keep
-                            new_key = (min(bye_team, keep), max(bye_team, keep))
+                            new_key = _pair_key(bye_team, keep)
                             new_count = global_matchup_counts.get(new_key, 0)
                             # Prefer swaps that don't create duplicate matchups
                             # (new_count == 0 is ideal)
@@ -602,7 +630,7 @@ def assign_rounds_to_slots(
 
                 # Replace the matchup
                 new_matchup = Matchup(bye_team, keep)
-                new_key = (min(bye_team, keep), max(bye_team, keep))
+                new_key = _pair_key(bye_team, keep)
                 safe_source = _lookup_safe_pool(bye_team, keep)
                 if safe_source:
                     slot._pending_matchups[mi] = (new_matchup, safe_source[0], safe_source[1])
@@ -614,10 +642,9 @@ def assign_rounds_to_slots(
                 all_teams_in_slot[si].add(bye_team)
 
                 # Update matchup counts
-                old_key = (min(old_matchup.team_a, old_matchup.team_b),
-                           max(old_matchup.team_a, old_matchup.team_b))
+                old_key = _pair_key(old_matchup.team_a, old_matchup.team_b)
                 global_matchup_counts[old_key] -= 1
-                new_key = (min(bye_team, keep), max(bye_team, keep))
+                new_key = _pair_key(bye_team, keep)
                 global_matchup_counts[new_key] += 1
 
                 # Update per-team counts
@@ -662,7 +689,7 @@ def assign_rounds_to_slots(
             candidates = []
             for i, t1 in enumerate(idle):
                 for t2 in idle[i + 1:]:
-                    key = (min(t1, t2), max(t1, t2))
+                    key = (t1, t2)  # idle is sorted
                     same_pool = teams[t1].pool == teams[t2].pool
                     # Prefer same-pool (0) over cross-pool (1)
                     pool_penalty = 0 if same_pool else 1
@@ -683,7 +710,7 @@ def assign_rounds_to_slots(
                     slot._pending_matchups.append((m, 0, "adhoc"))
                 teams_in_slot_map[si].add(ta)
                 teams_in_slot_map[si].add(tb)
-                key = (min(ta, tb), max(ta, tb))
+                key = _pair_key(ta, tb)
                 global_matchup_counts[key] += 1
                 extra_invented += 1
         return extra_invented
@@ -748,7 +775,7 @@ def assign_rounds_to_slots(
                                 if swap_out not in low_bye_teams:
                                     continue
                                 # Check: can bye_team play keep?
-                                new_key = (min(bye_team, keep), max(bye_team, keep))
+                                new_key = _pair_key(bye_team, keep)
                                 # Do the swap
                                 new_matchup = Matchup(bye_team, keep)
                                 safe_source = _lookup_safe_pool(bye_team, keep)
@@ -758,8 +785,7 @@ def assign_rounds_to_slots(
                                     slot._pending_matchups[mi] = (new_matchup, 0, "adhoc")
                                 tis_map[si].discard(swap_out)
                                 tis_map[si].add(bye_team)
-                                old_key = (min(matchup.team_a, matchup.team_b),
-                                           max(matchup.team_a, matchup.team_b))
+                                old_key = _pair_key(matchup.team_a, matchup.team_b)
                                 global_matchup_counts[old_key] -= 1
                                 global_matchup_counts[new_key] += 1
                                 swaps += 1
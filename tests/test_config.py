@@ -1,6 +1,9 @@
 """Tests for config.py — parsing and loading."""
 
 from datetime import date, time
+
+import pytest
+
 from d52sg.config import parse_time, parse_date, parse_date_range, load_config
 from d52sg.models import DayOfWeek
 
@@ -33,6 +36,25 @@ class TestParseTime:
     def test_whitespace(self):
         assert parse_time("  5:30pm  ") == time(17, 30)
 
+    def test_space_before_suffix(self):
+        assert parse_time("5:30 pm") == time(17, 30)
+
+    def test_uppercase_suffix_with_space(self):
+        assert parse_time("5:30 PM") == time(17, 30)
+        assert parse_time("12:00 AM") == time(0, 0)
+
+    def test_24hour_with_minutes(self):
+        assert parse_time("17:00") == time(17, 0)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            parse_time("noon")
+
+    def test_garbage(self):
+        for s in ("", "5:3pm", "5:30xm", "abc 5pm", "5:30pm later"):
+            with pytest.raises(ValueError):
+                parse_time(s)
+
 
 class TestParseDate:
     def test_basic(self):
@@ -42,6 +64,11 @@ class TestParseDate:
     def test_whitespace(self):
         assert parse_date(" 2026-03-07 ") == date(2026, 3, 7)
 
+    def test_unpadded(self):
+        assert parse_date("2026-3-5") == date(2026, 3, 5)
+        assert parse_date_range("2026-4-4:2026-4-12") == (date(2026, 4, 4),
+                                                          date(2026, 4, 12))
+
 
 class TestParseDateRange:
     def test_basic(self):
@@ -49,6 +76,10 @@ class TestParseDateRange:
         assert start == date(2026, 4, 4)
         assert end == date(2026, 4, 12)
 
+    def test_single_date(self):
+        assert parse_date_range("2026-03-21") == (date(2026, 3, 21),
+                                                  date(2026, 3, 21))
+
 
 class TestLoadConfig:
     def test_loads_real_config(self):
@@ -93,6 +93,32 @@ class TestValidateSchedule:
         assert not result["valid"]
         assert any("imbalance" in e for e in result["errors"])
 
+    def test_early_exit(self):
+        teams, leagues, pools = self._simple_setup()
+        games = [
+            _make_game("A", "B", date(2026, 3, 9), week=1, field=""),
+            _make_game("A", "C", date(2026, 3, 11), week=1, field=""),
+            _make_game("A", "D", date(2026, 3, 16), week=2, field=""),
+        ]
+        full = validate_schedule(games, teams, leagues, pools)
+        quick = validate_schedule(games, teams, leagues, pools,
+                                  early_exit=True)
+        assert not quick["valid"]
+        # Stops after the slot-block check, before home/away balance
+        assert quick["errors"] == ["A plays 2 games in week 11 weekday"]
+        assert len(full["errors"]) > len(quick["errors"])
+
+    def test_repeat_matchup_warning(self):
+        teams, leagues, pools = self._simple_setup()
+        games = [
+            _make_game("B", "A", date(2026, 3, 10), week=1),
+            _make_game("A", "B", date(2026, 3, 17), week=2),
+            _make_game("C", "D", date(2026, 3, 17), week=2),
+        ]
+        result = validate_schedule(games, teams, leagues, pools)
+        repeats = [w for w in result["warnings"] if "played" in w]
+        assert repeats == ["Intra-pool pair A vs B played 2 times"]
+
     def test_same_slot_block_violation(self):
         teams, leagues, pools = self._simple_setup()
         # A plays twice in the same weekday block
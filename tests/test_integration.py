@@ -186,3 +186,17 @@ class TestEndToEnd:
             assert result["valid"], (
                 f"Seed {seed}: {result['errors']}"
             )
+
+    def test_html_with_unknown_team(self):
+        """Games naming a team missing from the config (e.g. an edited CSV
+        loaded by d52sg-convert) still render, with the code escaped."""
+        from d52sg.output_html import format_schedule_html
+        config = load_config("config.yaml")
+        games = schedule(config, seed=42)
+        g = next(g for g in games if not g.unscheduled)
+        g.home_team = g.host_team = "NEW<1>"
+
+        html = format_schedule_html(games, config["teams"], config["leagues"],
+                                    pools=config["pools"])
+        assert "NEW&lt;1&gt;" in html
+        assert "NEW<1>" not in html
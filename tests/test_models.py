@@ -21,6 +21,7 @@ class TestDayOfWeek:
     def test_from_str_case_insensitive(self):
         assert DayOfWeek.from_str("tue") == DayOfWeek.Tue
         assert DayOfWeek.from_str("FRI") == DayOfWeek.Fri
+        assert DayOfWeek.from_str("sAtUrDaY") == DayOfWeek.Sat
 
     def test_is_weekday(self):
         for d in [DayOfWeek.Mon, DayOfWeek.Tue, DayOfWeek.Wed,
@@ -87,6 +88,23 @@ class TestLeague:
         assert not league.is_blacked_out(date(2026, 3, 9))
         assert league.is_blacked_out(date(2026, 4, 10))
 
+    def test_blackout_ranges_merged(self):
+        league = League(
+            code="T", full_name="T", teams=["T1"],
+            blackout_ranges=[
+                (date(2026, 4, 10), date(2026, 4, 12)),
+                (date(2026, 3, 7), date(2026, 3, 7)),
+                (date(2026, 4, 4), date(2026, 4, 9)),
+            ],
+        )
+        assert league.blackout_ranges == [
+            (date(2026, 3, 7), date(2026, 3, 7)),
+            (date(2026, 4, 4), date(2026, 4, 12)),
+        ]
+        assert league.is_blacked_out(date(2026, 4, 9))
+        assert league.is_blacked_out(date(2026, 4, 10))
+        assert not league.is_blacked_out(date(2026, 3, 8))
+
     def test_no_blackouts(self):
         league = League(code="T", full_name="T", teams=["T1"])
         assert not league.is_blacked_out(date(2026, 4, 4))
@@ -1,5 +1,7 @@
 """Tests for roundrobin.py — round-robin generation and verification."""
 
+import random
+
 from d52sg.roundrobin import (
     generate_round_robin,
     generate_crossover,
@@ -81,6 +83,12 @@ class TestGenerateRoundRobin:
                 assert ma.team_a == mb.team_a
                 assert ma.team_b == mb.team_b
 
+    def test_rng_matches_seed(self):
+        teams = ["A", "B", "C", "D", "E", "F", "G"]
+        r1 = generate_round_robin(teams, seed=7)
+        r2 = generate_round_robin(teams, rng=random.Random(7))
+        assert r1 == r2
+
     def test_different_seeds_differ(self):
         teams = ["A", "B", "C", "D", "E", "F"]
         r1 = generate_round_robin(teams, seed=1)
@@ -206,3 +214,15 @@ class TestVerifyRoundRobin:
         result = verify_round_robin(rounds, ["A", "B", "C"])
         assert not result["valid"]
         assert any("A" in e and "twice" in e for e in result["errors"])
+
+    def test_detects_missing_pair_with_unlisted_team(self):
+        """Right number of distinct pairs, but one involves an unknown team."""
+        from d52sg.models import Matchup, Round
+        rounds = [
+            Round(1, [Matchup("A", "B")]),
+            Round(2, [Matchup("A", "C")]),
+            Round(3, [Matchup("B", "Z")]),  # should be B vs C
+        ]
+        result = verify_round_robin(rounds, ["A", "B", "C"])
+        assert not result["valid"]
+        assert result["errors"] == ["B vs C: played 0 times (expected 1)"]
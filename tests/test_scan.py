@@ -0,0 +1,105 @@
+"""Tests for scan.py — the d52sg-scan command line."""
+
+import csv
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from d52sg import scan
+
+CONFIG = Path(__file__).resolve().parent.parent / "config.yaml"
+
+
+def _run_scan(monkeypatch, capsys, *args):
+    """Run d52sg-scan with args; return (exit code, stdout)."""
+    monkeypatch.setattr(sys, "argv", ["d52sg-scan", str(CONFIG), *args])
+    with pytest.raises(SystemExit) as exc:
+        scan.main()
+    return exc.value.code, capsys.readouterr().out
+
+
+def _rows(out):
+    """Per-seed table rows (between the two rules)."""
+    lines = out.splitlines()
+    first = lines.index("-" * 50)
+    last = lines.index("-" * 50, first + 1)
+    return lines[first + 1:last]
+
+
+class TestScanMain:
+    def test_jobs_give_same_rows(self, monkeypatch, capsys):
+        _, out1 = _run_scan(monkeypatch, capsys, "-n", "3", "-j", "1")
+        _, out2 = _run_scan(monkeypatch, capsys, "-n", "3", "-j", "2")
+        assert len(_rows(out1)) == 3
+        assert _rows(out1) == _rows(out2)
+
+    def test_rows_report_duplicate_counts(self, monkeypatch, capsys):
+        _, out = _run_scan(monkeypatch, capsys, "-n", "2", "-j", "1")
+        for row in _rows(out):
+            seed, games, unsched, dupes, status = row.split()
+            assert dupes.isdigit()
+            assert status in ("OK", "FAIL")
+
+    def test_format_csv(self, monkeypatch, capsys):
+        code, table = _run_scan(monkeypatch, capsys, "-n", "2", "-j", "1")
+        csv_code, out = _run_scan(monkeypatch, capsys, "-n", "2", "-j", "1",
+                                  "--format", "csv")
+        rows = list(csv.reader(out.splitlines()))
+        assert rows[0] == ["seed", "games", "unsched", "dupes", "result"]
+        assert rows[1:] == [row.split() for row in _rows(table)]
+        assert csv_code == code
+
+    def test_detailed_lists_duplicate_pairs(self, monkeypatch, capsys):
+        _, out = _run_scan(monkeypatch, capsys, "-n", "2", "-j", "1")
+        _, detailed = _run_scan(monkeypatch, capsys, "-n", "2", "-j", "1",
+                                "-d")
+        rows = _rows(out)
+        detailed_rows = _rows(detailed)
+        # Same per-seed rows, plus one "A vs B: N games" line per duplicate
+        assert [r for r in detailed_rows if " vs " not in r] == rows
+        n_dupes = sum(int(r.split()[3]) for r in rows)
+        assert sum(" vs " in r for r in detailed_rows) == n_dupes
+
+
+class TestScanCache:
+    def test_second_run_schedules_nothing(self, monkeypatch, capsys, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        _, first = _run_scan(monkeypatch, capsys, "-n", "2", "-j", "1",
+                             "--cache")
+        (cache_dir,) = (tmp_path / ".d52sg_scan_cache").iterdir()
+        assert sorted(p.name for p in cache_dir.iterdir()) == ["0.json",
+                                                               "1.json"]
+
+        # A config that can't be scheduled: any seed actually run would fail
+        monkeypatch.setattr(scan, "load_config", lambda path: {})
+        _, second = _run_scan(monkeypatch, capsys, "-n", "2", "-j", "1",
+                              "--cache")
+        assert _rows(second) == _rows(first)
+
+    def test_detailed_results_round_trip(self, monkeypatch, capsys, tmp_path):
+        monkeypatch.chdir(tmp_path)
+        _, first = _run_scan(monkeypatch, capsys, "-n", "1", "-j", "1",
+                             "-d", "--cache")
+        monkeypatch.setattr(scan, "load_config", lambda path: {})
+        _, second = _run_scan(monkeypatch, capsys, "-n", "1", "-j", "1",
+                              "-d", "--cache")
+        assert _rows(second) == _rows(first)
+
+    def test_config_change_invalidates(self, tmp_path):
+        config = tmp_path / "config.yaml"
+        shutil.copy(CONFIG, config)
+        before = scan._cache_dir(config)
+        with open(config, "a") as f:
+            f.write("# edited\n")
+        assert scan._cache_dir(config) != before
+
+    def test_source_change_invalidates(self, monkeypatch, tmp_path):
+        pkg = tmp_path / "d52sg"
+        shutil.copytree(Path(scan.__file__).parent, pkg)
+        monkeypatch.setattr(scan, "__file__", str(pkg / "scan.py"))
+        before = scan._cache_dir(CONFIG)
+        with open(pkg / "scheduler.py", "a") as f:
+            f.write("# edited\n")
+        assert scan._cache_dir(CONFIG) != before
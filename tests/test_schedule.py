@@ -0,0 +1,61 @@
+"""Tests for schedule.py — the d52sg generator command line."""
+
+import sys
+from pathlib import Path
+
+from d52sg import schedule
+
+CONFIG = Path(__file__).resolve().parent.parent / "config.yaml"
+
+ALL_FILES = ["gamechanger.csv", "schedule.html", "schedule.txt",
+             "schedule_edit.csv", "stats.txt"]
+
+
+def _run(monkeypatch, capsys, tmp_path, *args):
+    """Run d52sg --seed 42 into tmp_path/out; return stdout."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["d52sg", str(CONFIG), "--seed", "42",
+                                      "-o", "out", *args])
+    schedule.main()
+    return capsys.readouterr().out
+
+
+def _written(tmp_path):
+    out_dir = tmp_path / "out"
+    return sorted(p.name for p in out_dir.iterdir()) if out_dir.exists() else []
+
+
+class TestScheduleMain:
+    def test_writes_all_files(self, monkeypatch, capsys, tmp_path):
+        out = _run(monkeypatch, capsys, tmp_path)
+        assert _written(tmp_path) == ALL_FILES
+        assert "SCHEDULE STATISTICS" in out
+
+    def test_no_html(self, monkeypatch, capsys, tmp_path):
+        _run(monkeypatch, capsys, tmp_path, "--no-html")
+        assert _written(tmp_path) == [f for f in ALL_FILES
+                                      if f != "schedule.html"]
+
+    def test_dry_run_writes_nothing(self, monkeypatch, capsys, tmp_path):
+        out = _run(monkeypatch, capsys, tmp_path, "--dry-run")
+        assert _written(tmp_path) == []
+        assert "Written:" not in out
+        assert "SCHEDULE STATISTICS" in out
+
+    def test_no_output_alias(self, monkeypatch, capsys, tmp_path):
+        _run(monkeypatch, capsys, tmp_path, "--no-output")
+        assert _written(tmp_path) == []
+
+    def test_quiet_skips_stats_report(self, monkeypatch, capsys, tmp_path):
+        out = _run(monkeypatch, capsys, tmp_path, "-q")
+        assert "SCHEDULE STATISTICS" not in out
+        # The stats file is still written
+        assert _written(tmp_path) == ALL_FILES
+        stats = (tmp_path / "out" / "stats.txt").read_text()
+        assert "SCHEDULE STATISTICS" in stats
+
+    def test_dry_run_quiet(self, monkeypatch, capsys, tmp_path):
+        out = _run(monkeypatch, capsys, tmp_path, "--dry-run", "-q")
+        assert _written(tmp_path) == []
+        assert "SCHEDULE STATISTICS" not in out
+        assert "Validating..." in out